@@ -1,8 +1,9 @@
 """Account Management API Routes"""
 import asyncio
-from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from typing import List
-from backend.models.account import Account, AccountCreate, AccountUpdate, AccountStatus, AccountPublic, AccountImport, AccountCredentials
+from backend.models.account import Account, AccountCreate, AccountUpdate, AccountStatus, AccountPublic, AccountImport, AccountCredentials, AccountListResponse
+from backend.api.responses import cached_json_response
 from backend.services import account_service
 from backend.logger import logger
 
@@ -22,14 +23,16 @@ async def import_accounts(accounts: List[AccountImport]):
     """Batch import accounts from JSON array."""
     if len(accounts) > 500:
         raise HTTPException(status_code=400, detail="Maximum 500 accounts per import")
-    return await account_service.import_accounts([a.model_dump() for a in accounts])
+    return await account_service.import_accounts(accounts)
 
-@router.get("/")
+@router.get("/", response_class=Response, responses={200: {"model": AccountListResponse}})
 async def list_accounts(
+    request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
 ):
-    return await account_service.list_accounts(page, page_size)
+    # Rows come straight from the DB; skip per-request validation and re-encoding.
+    return await cached_json_response(request, lambda: account_service.list_accounts_json(page, page_size))
 
 @router.post("/", response_model=AccountPublic)
 async def create_account(account: AccountCreate):
@@ -40,6 +43,8 @@ async def create_account(account: AccountCreate):
 
 _check_all_running = False
 _check_all_lock = asyncio.Lock()
+# Strong references so fire-and-forget tasks are not garbage-collected mid-run
+_background_tasks: set[asyncio.Task] = set()
 
 async def _check_all_in_background():
     global _check_all_running
@@ -48,7 +53,7 @@ async def _check_all_in_background():
         sem = asyncio.Semaphore(3)
         async def check_one(acc):
             async with sem:
-                return await account_service.check_account_health(acc["id"])
+                return await account_service.check_account_health(acc["id"], acc)
         tasks = [check_one(acc) for acc in accounts]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         valid = [r for r in results if isinstance(r, dict)]
@@ -58,6 +63,13 @@ async def _check_all_in_background():
     finally:
         _check_all_running = False
 
+def _log_task_exception(task: asyncio.Task) -> None:
+    """Done callback for background tasks: drop the strong ref and log unexpected failures."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background task %s failed: %s", task.get_name(), task.exception())
+
+
 @router.post("/check-all", status_code=202)
 async def check_all_accounts():
     async with _check_all_lock:
@@ -66,7 +78,9 @@ async def check_all_accounts():
             raise HTTPException(status_code=409, detail="Health check already in progress")
         try:
             _check_all_running = True
-            asyncio.create_task(_check_all_in_background())
+            task = asyncio.create_task(_check_all_in_background())
+            _background_tasks.add(task)
+            task.add_done_callback(_log_task_exception)
             return {"status": "accepted", "message": "Account health check queued"}
         except Exception as e:
             _check_all_running = False
@@ -98,14 +112,11 @@ async def get_account(account_id: int):
 
 @router.put("/{account_id}", response_model=AccountPublic)
 async def update_account(account_id: int, account: AccountUpdate):
-    existing = await account_service.get_account(account_id)
-    if not existing:
-        raise HTTPException(status_code=404, detail="Account not found")
     result = await account_service.update_account(account_id, account.model_dump(exclude_unset=True))
     if result == "no_valid_fields":
         raise HTTPException(status_code=400, detail="No valid fields to update")
     if result is None:
-        raise HTTPException(status_code=404, detail="Account not found after update")
+        raise HTTPException(status_code=404, detail="Account not found")
     return result
 
 @router.delete("/{account_id}")
@@ -1,24 +1,37 @@
 """Auto-Reply Configuration API Routes"""
-from fastapi import APIRouter, HTTPException, Query
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from typing import List, Optional, Union
 
 from backend.config import AUTOREPLY_POLL_INTERVAL_SECONDS
+from backend.logger import logger
 from backend.models.task import (
     AutoReplyConfig,
     AutoReplyConfigCreate,
+    AutoReplyConfigListResponse,
     AutoReplyConfigUpdate,
     AutoReplyDefaultUpsert,
     AutoReplyStatus,
 )
+from backend.api.responses import cached_json_response
 from backend.services import autoreply_service
 
 router = APIRouter()
 
 
-@router.get("/config", response_model=List[AutoReplyConfig])
-async def list_autoreply_configs():
-    """Get all auto-reply configurations."""
-    return await autoreply_service.list_configs()
+@router.get(
+    "/config",
+    response_class=Response,
+    responses={200: {"model": Union[List[AutoReplyConfig], AutoReplyConfigListResponse]}},
+)
+async def list_autoreply_configs(
+    request: Request,
+    page: Optional[int] = Query(None, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
+):
+    """Get auto-reply configurations: the full list, or one page when `page` is given."""
+    if page is None:
+        return await cached_json_response(request, autoreply_service.list_configs_json)
+    return await cached_json_response(request, lambda: autoreply_service.list_configs_page_json(page, page_size))
 
 
 @router.post("/config", response_model=AutoReplyConfig)
@@ -90,7 +103,6 @@ async def start_autoreply_service(
     interval: int = Query(default=AUTOREPLY_POLL_INTERVAL_SECONDS, ge=1)
 ):
     """Deprecated: use /enable instead. Will be removed after 2026-06-01."""
-    from backend.logger import logger
     logger.warning("Deprecated endpoint /autoreply/start called; use /enable instead")
     return await enable_autoreply_service(interval)
 
@@ -98,6 +110,5 @@ async def start_autoreply_service(
 @router.post("/stop", deprecated=True)
 async def stop_autoreply_service():
     """Deprecated: use /disable instead. Will be removed after 2026-06-01."""
-    from backend.logger import logger
     logger.warning("Deprecated endpoint /autoreply/stop called; use /disable instead")
     return await disable_autoreply_service()
@@ -1,8 +1,9 @@
 """System Configuration API Routes"""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 from typing import Any
-from backend.services.config_service import get_config, set_config, get_all_configs, set_configs_batch_atomic
+from backend.api.responses import cached_json_response
+from backend.services.config_service import get_config, set_config, get_all_configs_json, set_configs_batch_atomic
 
 router = APIRouter()
 
@@ -20,9 +21,9 @@ class ConfigBatchResponse(BaseModel):
     message: str
     updated_keys: list[str]
 
-@router.get("/")
-async def list_configs():
-    return await get_all_configs()
+@router.get("/", response_class=Response, responses={200: {"model": dict[str, Any]}})
+async def list_configs(request: Request):
+    return await cached_json_response(request, get_all_configs_json)
 
 @router.get("/{key}", response_model=ConfigResponse)
 async def get_config_value(key: str):
@@ -1,6 +1,6 @@
 """Report Execution API Routes"""
 import asyncio
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from typing import List
 
 from backend.models.report import (
@@ -8,31 +8,37 @@ from backend.models.report import (
     ReportLog, ReportResult, BatchReportResult,
     CommentScanRequest, CommentScanResult,
 )
+from backend.api.responses import cached_json_response
 from backend.services import report_service, target_service
 from backend.services.report_service import claim_target_for_processing
-from backend.database import execute_insert
+from backend.config import REPORT_QUEUE_SIZE, REPORT_WORKERS
 from backend.logger import logger
 
 router = APIRouter()
 
+# Report jobs run on a fixed pool of workers instead of one task per request
+_job_queue: asyncio.Queue | None = None
+_workers: list[asyncio.Task] = []
+
 
 async def _run_report_in_background(target_id: int, account_ids: list[int] | None):
-    """Fire-and-forget wrapper for report execution."""
+    """Fire-and-forget wrapper for report execution.
+
+    The target is claimed only once a worker picks the job up, so a queued target stays
+    'pending' and nothing needs recovering if the process stops before the job runs.
+    """
+    # Atomic CAS to claim target for processing; the claimed row comes back with it
+    target = await claim_target_for_processing(target_id)
+    if not target:
+        logger.info("Target %s was claimed elsewhere before its queued report ran", target_id)
+        return
     try:
-        results, error = await report_service.execute_report_for_target(target_id, account_ids)
+        results, error = await report_service.execute_report_for_target(target_id, account_ids, target=target)
         if error:
-            await target_service.update_target_status(target_id, "failed")
-            await execute_insert(
-                "INSERT INTO report_logs (target_id, action, success, error_message) VALUES (?, ?, ?, ?)",
-                (target_id, "no_accounts", False, error)
-            )
+            await report_service.fail_target_with_log(target_id, "no_accounts", error)
     except Exception as e:
         logger.error("Background report execution failed for target %s: %s", target_id, e)
-        await target_service.update_target_status(target_id, "failed")
-        await execute_insert(
-            "INSERT INTO report_logs (target_id, action, success, error_message) VALUES (?, ?, ?, ?)",
-            (target_id, "background_task_crash", False, str(e))
-        )
+        await report_service.fail_target_with_log(target_id, "background_task_crash", str(e))
 
 
 async def _run_batch_in_background(target_ids: list[int] | None, account_ids: list[int] | None):
@@ -49,38 +55,59 @@ async def _run_batch_in_background(target_ids: list[int] | None, account_ids: li
         logger.error("Background batch execution failed: %s", e)
 
 
+async def _report_worker(queue: asyncio.Queue):
+    """Run queued report jobs one at a time."""
+    while True:
+        job, args = await queue.get()
+        try:
+            await job(*args)
+        except Exception as e:
+            logger.error("Background report job %s failed: %s", job.__name__, e)
+        finally:
+            queue.task_done()
+
+
+def start_report_workers():
+    """Start the report worker pool if it is not running yet."""
+    global _job_queue
+    if _workers:
+        return
+    _job_queue = asyncio.Queue(maxsize=REPORT_QUEUE_SIZE)
+    _workers.extend(asyncio.create_task(_report_worker(_job_queue)) for _ in range(REPORT_WORKERS))
+
+
+async def stop_report_workers():
+    """Cancel the worker pool; targets left in 'processing' are recovered on next startup."""
+    global _job_queue
+    for worker in _workers:
+        worker.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+    _job_queue = None
+
+
+def _enqueue_job(job, *args) -> bool:
+    """Queue a report job; returns False when the queue is full."""
+    start_report_workers()
+    try:
+        _job_queue.put_nowait((job, args))
+    except asyncio.QueueFull:
+        return False
+    return True
+
+
 @router.post("/execute", status_code=202)
 async def execute_report(request: ReportExecuteRequest):
     """Fire-and-forget: immediately returns, processes report in background."""
-    from backend.services import target_service
     target = await target_service.get_target(request.target_id)
     if not target:
         raise HTTPException(status_code=404, detail="Target not found")
-
-    # Atomic CAS to claim target for processing
-    claimed = await claim_target_for_processing(request.target_id)
-    if not claimed:
+    if target["status"] != "pending":
         raise HTTPException(status_code=409, detail="Target is already being processed or completed")
 
-    # Create task with error handling
-    task = None
-    try:
-        task = asyncio.create_task(_run_report_in_background(request.target_id, request.account_ids))
-    except Exception as e:
-        # Rollback status if task creation fails
-        logger.error("Failed to create background task for target %s: %s", request.target_id, e)
-        await target_service.update_target_status(request.target_id, "pending")
-        raise HTTPException(status_code=500, detail="Failed to queue report execution")
-
-    # Add exception handler to background task
-    def handle_task_exception(t):
-        try:
-            t.result()
-        except Exception as e:
-            logger.error("Background report task failed for target %s: %s", request.target_id, e)
-
-    if task:
-        task.add_done_callback(handle_task_exception)
+    if not _enqueue_job(_run_report_in_background, request.target_id, request.account_ids):
+        logger.warning("Report queue full, rejecting target %s", request.target_id)
+        raise HTTPException(status_code=503, detail="Report queue is full", headers={"Retry-After": "30"})
 
     return {"status": "accepted", "target_id": request.target_id, "message": "Report queued for execution"}
 
@@ -88,36 +115,23 @@ async def execute_report(request: ReportExecuteRequest):
 @router.post("/execute/batch", status_code=202)
 async def execute_batch_reports(request: ReportBatchExecuteRequest):
     """Fire-and-forget: immediately returns, processes batch in background."""
-    task = None
-    try:
-        task = asyncio.create_task(_run_batch_in_background(request.target_ids, request.account_ids))
-    except Exception as e:
-        logger.error("Failed to create batch background task: %s", e)
-        raise HTTPException(status_code=500, detail="Failed to queue batch execution")
-
-    # Add exception handler to background task
-    def handle_task_exception(t):
-        try:
-            t.result()
-        except Exception as e:
-            logger.error("Background batch task failed: %s", e)
-
-    if task:
-        task.add_done_callback(handle_task_exception)
+    if not _enqueue_job(_run_batch_in_background, request.target_ids, request.account_ids):
+        logger.warning("Report queue full, rejecting batch execution")
+        raise HTTPException(status_code=503, detail="Report queue is full", headers={"Retry-After": "30"})
 
     return {"status": "accepted", "message": "Batch execution queued"}
 
 
-@router.get("/logs", response_model=List[ReportLog])
-async def get_report_logs(limit: int = Query(default=100, ge=1, le=1000)):
+@router.get("/logs", response_class=Response, responses={200: {"model": List[ReportLog]}})
+async def get_report_logs(request: Request, limit: int = Query(default=100, ge=1, le=1000)):
     """Get recent report logs."""
-    return await report_service.get_report_logs(limit)
+    return await cached_json_response(request, lambda: report_service.get_report_logs_json(limit))
 
 
-@router.get("/logs/{target_id}", response_model=List[ReportLog])
-async def get_target_logs(target_id: int, limit: int = Query(default=100, ge=1, le=1000)):
+@router.get("/logs/{target_id}", response_class=Response, responses={200: {"model": List[ReportLog]}})
+async def get_target_logs(request: Request, target_id: int, limit: int = Query(default=100, ge=1, le=1000)):
     """Get logs for a specific target."""
-    return await report_service.get_target_logs(target_id, limit)
+    return await cached_json_response(request, lambda: report_service.get_target_logs_json(target_id, limit))
 
 
 @router.post("/scan-comments", response_model=CommentScanResult)
@@ -0,0 +1,42 @@
+"""Shared response helpers for API routes."""
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from backend.logger import logger
+
+# Last successfully served body per URL, used when the DB is briefly unavailable
+_LAST_GOOD_MAX_ENTRIES = 64
+_last_good: OrderedDict[str, bytes] = OrderedDict()
+
+
+async def cached_json_response(request: Request, load_body: Callable[[], Awaitable[bytes]]) -> Response:
+    """Serve a pre-encoded JSON body with a content ETag, or an empty 304 if the client already has it.
+
+    If loading fails with a database error, the last body served for this URL is returned
+    with a ``Warning: 110`` header instead of a 500.
+    """
+    url_key = str(request.url)
+    headers = {"Cache-Control": "no-cache"}
+    try:
+        body = await load_body()
+    except sqlite3.Error as e:
+        body = _last_good.get(url_key)
+        if body is None:
+            raise
+        logger.warning("Serving stale response for %s: %s", request.url.path, e)
+        headers["Warning"] = '110 - "Response is Stale"'
+    else:
+        _last_good[url_key] = body
+        _last_good.move_to_end(url_key)
+        if len(_last_good) > _LAST_GOOD_MAX_ENTRIES:
+            _last_good.popitem(last=False)
+
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers["ETag"] = etag
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -46,10 +46,10 @@ async def create_target(target: TargetCreate):
 @router.post("/batch")
 async def create_targets_batch(batch: TargetBatchCreate):
     """Add multiple targets at once."""
-    count = await target_service.create_targets_batch(
+    ids = await target_service.create_targets_batch(
         batch.type, batch.identifiers, batch.reason_id, batch.reason_content_id, batch.reason_text
     )
-    return {"message": f"Created {count} targets", "count": count}
+    return {"message": f"Created {len(ids)} targets", "count": len(ids), "ids": ids}
 
 
 @router.get("/{target_id}", response_model=Target)
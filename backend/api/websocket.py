@@ -2,7 +2,6 @@
 WebSocket API for Real-time Log Streaming
 """
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import List
 import asyncio
 import hmac
 import json
@@ -11,12 +10,54 @@ import time
 
 router = APIRouter()
 
+# Log lines arriving within this window are coalesced into one frame
+_BATCH_WINDOW_SECONDS = 0.05
+_BATCH_MAX_ITEMS = 64
+# Per-subscriber backlog; a client that falls this far behind starts losing log lines
+_SUBSCRIBER_QUEUE_SIZE = 1000
+# Compact, UTF-8 native encoding: log text is mostly Chinese, which \uXXXX escaping doubles in size
+_encode_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+class _Subscriber:
+    """A connected client with its own bounded outbound queue."""
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+
+    def offer(self, message: dict | str) -> None:
+        """Queue a message (or its pre-encoded JSON) without blocking; drop it if the client is too slow."""
+        if isinstance(message, dict):
+            message = _encode_json(message)
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            pass
+
+    async def run_sender(self) -> None:
+        """Drain the queue, sending a lone message as an object and bursts as one JSON array."""
+        while True:
+            batch = [await self.queue.get()]
+            await asyncio.sleep(_BATCH_WINDOW_SECONDS)
+            while len(batch) < _BATCH_MAX_ITEMS and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                await self.websocket.send_text(batch[0] if len(batch) == 1 else f"[{','.join(batch)}]")
+            except Exception:
+                # Client is gone; stop receiving broadcasts
+                _clients.discard(self)
+                return
+
+
 # Connected clients
-_clients: List[WebSocket] = []
+_clients: set[_Subscriber] = set()
 
 
 async def broadcast_log(log_type: str, message: str, data: dict = None, log_id: int = None):
     """Broadcast a log message to all connected clients."""
+    if not _clients:
+        return
     payload_dict = {
         "type": log_type,
         "message": message,
@@ -25,18 +66,11 @@ async def broadcast_log(log_type: str, message: str, data: dict = None, log_id:
     }
     if log_id is not None:
         payload_dict["id"] = log_id
-    payload = json.dumps(payload_dict)
-    
-    disconnected = []
+
+    # Encode once; every subscriber queues the same string
+    payload = _encode_json(payload_dict)
     for client in _clients:
-        try:
-            await client.send_text(payload)
-        except Exception:
-            disconnected.append(client)
-    
-    # Clean up disconnected clients
-    for client in disconnected:
-        _clients.remove(client)
+        client.offer(payload)
 
 
 @router.websocket("/ws/logs")
@@ -56,33 +90,35 @@ async def websocket_logs(websocket: WebSocket):
                 break
 
     if api_key:
-        if not token or not hmac.compare_digest(token, api_key):
+        if not token or not hmac.compare_digest(token.encode(), api_key.encode()):
             await websocket.close(code=1008, reason="Unauthorized")
             return
 
     await websocket.accept(subprotocol=subprotocol)
-    _clients.append(websocket)
-    
+    subscriber = _Subscriber(websocket)
+    _clients.add(subscriber)
+    sender = asyncio.create_task(subscriber.run_sender())
+
     try:
         # Send welcome message
-        await websocket.send_json({
+        subscriber.offer({
             "type": "connected",
             "message": "Connected to Bili-Sentinel log stream"
         })
-        
+
         # Keep connection alive and listen for messages
         while True:
             try:
                 data = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
                 # Handle ping/pong or filter commands
                 if data == "ping":
-                    await websocket.send_json({"type": "pong"})
+                    subscriber.offer({"type": "pong"})
             except asyncio.TimeoutError:
                 # Send heartbeat
-                await websocket.send_json({"type": "heartbeat"})
-                
+                subscriber.offer({"type": "heartbeat"})
+
     except WebSocketDisconnect:
         pass
     finally:
-        if websocket in _clients:
-            _clients.remove(websocket)
+        sender.cancel()
+        _clients.discard(subscriber)
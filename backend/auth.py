@@ -6,9 +6,11 @@ import os
 from fastapi import HTTPException, Request
 
 _API_KEY = os.getenv("SENTINEL_API_KEY", "")
+# Compared as bytes: compare_digest rejects non-ASCII str, which would turn a bad header into a 500
+_API_KEY_BYTES = _API_KEY.encode()
 
 # Routes that skip authentication
-_PUBLIC_PATHS = {"/", "/health", "/docs", "/redoc", "/openapi.json"}
+_PUBLIC_PATHS = frozenset({"/", "/health", "/docs", "/redoc", "/openapi.json"})
 
 
 async def verify_api_key(request: Request):
@@ -19,11 +21,11 @@ async def verify_api_key(request: Request):
     # WebSocket connections are handled by their own auth logic
     if request.scope.get("type") == "websocket":
         return
-    if not _API_KEY:
+    if not _API_KEY_BYTES:
         return  # Auth disabled when API key not set
     if request.url.path in _PUBLIC_PATHS:
         return  # public route
     api_key = request.headers.get("x-api-key")
-    if api_key and hmac.compare_digest(api_key, _API_KEY):
+    if api_key and hmac.compare_digest(api_key.encode(), _API_KEY_BYTES):
         return
     raise HTTPException(status_code=401, detail="Invalid or missing API key")
@@ -34,6 +34,9 @@ HTTP_TIMEOUT = float(os.getenv("SENTINEL_HTTP_TIMEOUT", "10.0"))
 HTTP_TIMEOUT = max(HTTP_TIMEOUT, 1.0)  # Minimum 1s timeout
 MAX_RETRIES = int(os.getenv("SENTINEL_MAX_RETRIES", "3"))
 MAX_RETRIES = max(MAX_RETRIES, 1)  # Minimum 1 attempt
+# Per-host request budget shared by all Bilibili clients (token bucket); 0 disables it
+BILIBILI_HOST_RATE = max(_get_int_env("SENTINEL_BILIBILI_HOST_RATE", 0), 0)  # requests/second
+BILIBILI_HOST_BURST = max(_get_int_env("SENTINEL_BILIBILI_HOST_BURST", 10), 1)
 
 # Worker settings
 WORKERS = int(os.getenv("SENTINEL_WORKERS", "1"))
@@ -42,6 +45,17 @@ WORKERS = int(os.getenv("SENTINEL_WORKERS", "1"))
 MIN_DELAY = 3.0  # seconds (raised from 2.0 for safety)
 MAX_DELAY = 12.0  # seconds (raised from 10.0)
 ACCOUNT_COOLDOWN = 90.0  # seconds between same account's consecutive reports (B站 requires ~90-120s)
+# Targets processed concurrently by a batch report run (accounts per target stay sequential)
+REPORT_BATCH_CONCURRENCY = max(
+    _get_int_env("SENTINEL_REPORT_BATCH_CONCURRENCY", 5), 1
+)
+# Background report jobs: workers draining the queue, and how many jobs may wait before the API returns 503
+REPORT_WORKERS = max(_get_int_env("SENTINEL_REPORT_WORKERS", 4), 1)
+REPORT_QUEUE_SIZE = max(_get_int_env("SENTINEL_REPORT_QUEUE_SIZE", 100), 1)
+
+# APScheduler job policy: concurrent runs allowed per task, and how late a missed run may still fire
+SCHEDULER_MAX_INSTANCES = max(_get_int_env("SENTINEL_SCHED_MAX_INSTANCES", 1), 1)
+SCHEDULER_MISFIRE_GRACE_SECONDS = max(_get_int_env("SENTINEL_SCHED_GRACE", 60), 1)
 
 # Auto-reply polling defaults
 AUTOREPLY_POLL_INTERVAL_SECONDS = max(
@@ -56,6 +70,13 @@ AUTOREPLY_ACCOUNT_BATCH_SIZE = max(
 AUTOREPLY_SESSION_BATCH_SIZE = max(
     _get_int_env("SENTINEL_AUTOREPLY_SESSION_BATCH_SIZE", 5), 0
 )
+# Upper bound the standalone poll interval may back off to while no new messages arrive (0 = off)
+AUTOREPLY_IDLE_MAX_INTERVAL_SECONDS = max(
+    _get_int_env("SENTINEL_AUTOREPLY_IDLE_MAX_INTERVAL_SECONDS", 0), 0
+)
+AUTOREPLY_ACCOUNT_CONCURRENCY = max(
+    _get_int_env("SENTINEL_AUTOREPLY_ACCOUNT_CONCURRENCY", 5), 1
+)
 
 USER_AGENTS = [
     # Chrome (Windows)
@@ -10,6 +10,7 @@ from backend.logger import logger
 _wbi_cache: dict = {"img_key": "", "sub_key": "", "refreshed_at": 0.0}
 _wbi_refresh_lock = asyncio.Lock()
 _WBI_TTL_SECONDS = 3600  # Refresh WBI keys every 1 hour
+_wbi_refresh_task: asyncio.Task | None = None
 
 
 class BilibiliAuth:
@@ -106,6 +107,12 @@ class BilibiliAuth:
                 logger.error("WBI refresh failed: %s", e)
             return False
 
+    def schedule_wbi_refresh(self) -> None:
+        """Refresh WBI keys in the background; at most one refresh is in flight at a time."""
+        global _wbi_refresh_task
+        if _wbi_refresh_task is None or _wbi_refresh_task.done():
+            _wbi_refresh_task = asyncio.create_task(self.refresh_wbi_keys())
+
     def get_wbi_keys(self) -> tuple[str, str]:
         """Return WBI keys, preferring module cache if instance keys are empty."""
         img = self.wbi_keys.get("img_key") or _wbi_cache.get("img_key", "")
@@ -7,7 +7,9 @@ import time
 from fastapi import HTTPException
 from backend.core.wbi_sign import BilibiliSign
 from backend.core.bilibili_auth import BilibiliAuth
-from backend.config import HTTP_TIMEOUT, MAX_RETRIES, USER_AGENTS
+from urllib.parse import quote, urlsplit
+
+from backend.config import BILIBILI_HOST_BURST, BILIBILI_HOST_RATE, HTTP_TIMEOUT, MAX_RETRIES, USER_AGENTS
 from backend.logger import logger
 
 
@@ -19,10 +21,86 @@ def _human_delay(min_s: float, max_s: float) -> float:
     return max(min_s, min(delay, max_s * 1.5))
 
 
+class _TokenBucket:
+    """Token bucket: bursts up to `capacity` requests, then refills at `rate` per second."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def _reserve(self) -> float:
+        """Take a token (possibly going into debt) and return how long the caller must wait."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_host_buckets: dict[str, _TokenBucket] = {}
+
+
+async def _acquire_host_slot(url: str):
+    """Wait for the per-host budget when SENTINEL_BILIBILI_HOST_RATE is set; no-op otherwise."""
+    if BILIBILI_HOST_RATE <= 0:
+        return
+    host = urlsplit(url).hostname or ""
+    bucket = _host_buckets.get(host)
+    if bucket is None:
+        bucket = _host_buckets[host] = _TokenBucket(BILIBILI_HOST_RATE, BILIBILI_HOST_BURST)
+    await bucket.acquire()
+
+
+def _retry_after_seconds(resp, attempt: int) -> float:
+    """Seconds to wait after an HTTP 429: the Retry-After header if numeric, else exponential backoff."""
+    try:
+        return max(float(resp.headers.get("retry-after")), 0.0)
+    except (TypeError, ValueError):
+        return 5 * (2 ** attempt) + random.uniform(0, 2)
+
+
+def format_cookie_header(cookies: dict) -> str:
+    """Build a Cookie header value, escaping values that contain special characters."""
+    return "; ".join(f"{k}={quote(str(v), safe='')}" for k, v in cookies.items())
+
+
+_shared_client: httpx.AsyncClient | None = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled client (keep-alive across accounts), creating it lazily."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _shared_client
+
+
+async def close_shared_http_client():
+    """Close the process-wide pooled client."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
 class BilibiliClient:
-    """Consolidated client for Bilibili reporting and interaction with anti-detection."""
+    """Consolidated client for Bilibili reporting and interaction with anti-detection.
+
+    Pass ``client`` (see get_shared_http_client) to reuse pooled connections; cookies and
+    headers are then sent per request and the shared client is left open on close().
+    """
     
-    def __init__(self, auth: BilibiliAuth, account_index: int = 0):
+    def __init__(self, auth: BilibiliAuth, account_index: int = 0, client: httpx.AsyncClient | None = None):
         self.auth = auth
         self.account_index = account_index
         self.cookies = auth.get_cookies(account_index)
@@ -63,11 +141,32 @@ class BilibiliClient:
             "Sec-Fetch-Mode": "cors",
             "Sec-Fetch-Site": "same-site",
         }
-        self._client = httpx.AsyncClient(cookies=self.cookies, headers=self.headers, timeout=HTTP_TIMEOUT)
+        # Cookies are fixed for the client's lifetime, so quote them once
+        self._cookie_value = format_cookie_header(self.cookies)
+        # Constant part of cross-subdomain request headers; Referer/Origin vary per call
+        self._cross_base_headers = {
+            "User-Agent": ua,
+            "Accept": "*/*",
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Cookie": self._cookie_value,
+        }
+        self._owns_client = client is None
+        if self._owns_client:
+            self._client = httpx.AsyncClient(cookies=self.cookies, headers=self.headers, timeout=HTTP_TIMEOUT)
+            # Alias the client's own headers so Referer tweaks below apply to it directly
+            self.headers = self._client.headers
+        else:
+            self._client = client
+            self.headers["Cookie"] = self._cookie_value
+
+    def _request_kwargs(self) -> dict:
+        # Shared clients carry no per-account state, so headers/cookies go on each request
+        return {} if self._owns_client else {"headers": self.headers}
 
     async def close(self):
-        """Close the underlying httpx client."""
-        await self._client.aclose()
+        """Close the underlying httpx client (shared clients stay open)."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self):
         return self
@@ -83,24 +182,34 @@ class BilibiliClient:
 
         account_name = self.auth.accounts[self.account_index]["name"]
 
-        # Auto-refresh WBI keys if stale and signing is needed
-        if sign and BilibiliAuth.wbi_keys_stale():
-            logger.info("[%s] WBI keys stale, refreshing...", account_name)
-            await self.auth.refresh_wbi_keys()
-
         if sign:
             img_key, sub_key = self.auth.get_wbi_keys()
+            if BilibiliAuth.wbi_keys_stale():
+                if img_key:
+                    # Expired keys still sign fine for a while; renew off the request path
+                    self.auth.schedule_wbi_refresh()
+                else:
+                    logger.info("[%s] No WBI keys yet, refreshing...", account_name)
+                    await self.auth.refresh_wbi_keys()
+                    img_key, sub_key = self.auth.get_wbi_keys()
             signer = BilibiliSign(img_key, sub_key)
             params = signer.sign(params)
 
         last_error = None
         for attempt in range(retries):
             try:
+                await _acquire_host_slot(url)
                 if method == "POST":
                     data["csrf"] = self.cookies.get("bili_jct", "")
-                    resp = await self._client.post(url, params=params, data=data)
+                    resp = await self._client.post(url, params=params, data=data, **self._request_kwargs())
                 else:
-                    resp = await self._client.get(url, params=params)
+                    resp = await self._client.get(url, params=params, **self._request_kwargs())
+
+                if resp.status_code == 429:
+                    wait_time = _retry_after_seconds(resp, attempt)
+                    logger.warning("[%s] HTTP 429 from %s. Waiting %.1fs...", account_name, url, wait_time)
+                    await asyncio.sleep(wait_time)
+                    continue
 
                 # Debug: log response details before parsing
                 logger.debug("[%s] Response status: %s, content-type: %s, content-length: %s",
@@ -221,26 +330,33 @@ class BilibiliClient:
         bili_jct = self.cookies.get("bili_jct", "")
         data["csrf"] = bili_jct
 
-        # Properly escape cookie values to handle special characters
-        from urllib.parse import quote
-        cookie_parts = [f"{k}={quote(str(v), safe='')}" for k, v in self.cookies.items()]
-        cookie_header = "; ".join(cookie_parts)
-
-        headers = {
-            "User-Agent": self._client.headers.get("User-Agent", ""),
-            "Referer": referer,
-            "Origin": origin,
-            "Accept": "*/*",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Cookie": cookie_header,
-        }
+        headers = {**self._cross_base_headers, "Referer": referer, "Origin": origin}
 
         last_error = None
         for attempt in range(retries):
             try:
-                async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as tmp_client:
-                    resp = await tmp_client.post(url, data=data, headers=headers)
-                res_json = resp.json()
+                await _acquire_host_slot(url)
+                # An owned client carries a cookie jar that would duplicate the explicit Cookie
+                # header, so fall back to the cookie-less shared pool rather than a throwaway client
+                http = get_shared_http_client() if self._owns_client else self._client
+                resp = await http.post(url, data=data, headers=headers)
+
+                if resp.status_code == 429:
+                    wait_time = _retry_after_seconds(resp, attempt)
+                    logger.warning("[%s] HTTP 429 from %s. Waiting %.1fs...", account_name, url, wait_time)
+                    await asyncio.sleep(wait_time)
+                    continue
+
+                try:
+                    res_json = resp.json()
+                except ValueError as json_err:
+                    # Gateway error pages and empty bodies are transient; retry like a network error
+                    last_error = json_err
+                    wait_time = (attempt + 1) * 2
+                    logger.warning("[%s] Non-JSON response from %s (HTTP %s). Retrying in %ds...",
+                                   account_name, url, resp.status_code, wait_time)
+                    await asyncio.sleep(wait_time)
+                    continue
 
                 # Check for Bilibili error codes that warrant retry
                 code = res_json.get("code")
@@ -269,7 +385,7 @@ class BilibiliClient:
         reason: 1 (Ad), 2 (Porn), 3 (Spam), 7 (Personal Attack), etc.
         """
         if bvid:
-            self._client.headers["Referer"] = f"https://www.bilibili.com/video/{bvid}/"
+            self.headers["Referer"] = f"https://www.bilibili.com/video/{bvid}/"
         url = "https://api.bilibili.com/x/v2/reply/report"
         data = {
             "type": type_code,
@@ -279,7 +395,7 @@ class BilibiliClient:
             "content": content
         }
         result = await self._post(url, data=data)
-        self._client.headers["Referer"] = "https://www.bilibili.com/"
+        self.headers["Referer"] = "https://www.bilibili.com/"
         return result
 
     async def report_video(self, aid: int, reason: int, content: str = "", bvid: str = ""):
@@ -290,7 +406,7 @@ class BilibiliClient:
         """
         # Dynamic Referer to mimic browsing the actual video page
         if bvid:
-            self._client.headers["Referer"] = f"https://www.bilibili.com/video/{bvid}/"
+            self.headers["Referer"] = f"https://www.bilibili.com/video/{bvid}/"
         url = "https://api.bilibili.com/x/web-interface/archive/report"
         data = {
             "aid": aid,
@@ -298,7 +414,7 @@ class BilibiliClient:
             "content": content
         }
         result = await self._post(url, data=data)
-        self._client.headers["Referer"] = "https://www.bilibili.com/"
+        self.headers["Referer"] = "https://www.bilibili.com/"
         return result
 
     async def send_private_message(self, receiver_id: int, content: str):
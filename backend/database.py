@@ -4,6 +4,7 @@ Singleton connection with asyncio.Lock for concurrency safety.
 """
 import asyncio
 import aiosqlite
+import sqlite3
 import time
 from pathlib import Path
 from typing import Awaitable, Callable, TypeVar
@@ -15,18 +16,27 @@ _lock = asyncio.Lock()
 _db_initialized = False
 
 # Simple TTL cache
-_cache: dict[str, tuple[float, list[dict]]] = {}
+_cache: dict[str, tuple[float, list[dict] | dict | bytes]] = {}
 _cache_lock = asyncio.Lock()
 T = TypeVar("T")
 
+# sqlite3 keeps parsed statements per connection keyed by SQL text; size it
+# above the number of distinct queries the app issues so hot ones never re-parse.
+_STATEMENT_CACHE_SIZE = 256
+
 
 async def _get_connection() -> aiosqlite.Connection:
     """Get or create the singleton database connection."""
     global _connection
     if _connection is None:
-        _connection = await aiosqlite.connect(DATABASE_PATH)
+        _connection = await aiosqlite.connect(DATABASE_PATH, cached_statements=_STATEMENT_CACHE_SIZE)
         _connection.row_factory = aiosqlite.Row
         await _connection.execute("PRAGMA journal_mode=WAL")
+        # WAL only needs fsync at checkpoints; NORMAL stays crash-safe for the DB file
+        await _connection.execute("PRAGMA synchronous=NORMAL")
+        await _connection.execute("PRAGMA busy_timeout=5000")
+        await _connection.execute("PRAGMA cache_size=-64000")  # ~64 MB page cache
+        await _connection.execute("PRAGMA temp_store=MEMORY")
     return _connection
 
 
@@ -38,6 +48,10 @@ async def init_db():
 
     schema_path = Path(__file__).parent / "db" / "schema.sql"
 
+    # RETURNING clauses used by the services need SQLite 3.35+
+    if sqlite3.sqlite_version_info < (3, 35, 0):
+        raise RuntimeError(f"SQLite >= 3.35 is required, found {sqlite3.sqlite_version}")
+
     async with _lock:
         if _db_initialized:
             return
@@ -81,6 +95,15 @@ async def execute_insert(query: str, params: tuple = ()) -> int:
         return cursor.lastrowid
 
 
+async def execute_write(query: str, params: tuple = ()) -> int:
+    """Execute a write and return the number of affected rows."""
+    async with _lock:
+        conn = await _get_connection()
+        cursor = await conn.execute(query, params)
+        await conn.commit()
+        return cursor.rowcount
+
+
 async def execute_many(query: str, params_list: list):
     """Execute a query with multiple parameter sets."""
     async with _lock:
@@ -114,7 +137,7 @@ async def close_db():
         logger.info("Database connection closed")
 
 
-async def _get_cached(key: str, ttl: int) -> list[dict] | None:
+async def _get_cached(key: str, ttl: int) -> list[dict] | dict | bytes | None:
     """Get cached result if not expired."""
     async with _cache_lock:
         if key in _cache:
@@ -125,7 +148,7 @@ async def _get_cached(key: str, ttl: int) -> list[dict] | None:
     return None
 
 
-async def _set_cache(key: str, data: list[dict], ttl: int):
+async def _set_cache(key: str, data: list[dict] | dict | bytes, ttl: int):
     """Set cache with TTL."""
     async with _cache_lock:
         _cache[key] = (time.time() + ttl, data)
@@ -139,6 +162,16 @@ async def invalidate_cache(pattern: str):
             del _cache[k]
 
 
+async def get_or_load_cached(key: str, ttl: int, loader: Callable[[], Awaitable[T]]) -> T:
+    """Return the cached value for key, or run loader and cache its result for ttl seconds."""
+    cached = await _get_cached(key, ttl)
+    if cached is not None:
+        return cached
+    result = await loader()
+    await _set_cache(key, result, ttl)
+    return result
+
+
 async def get_active_accounts_cached():
     """Get active accounts with 60s cache."""
     cache_key = "active_accounts"
@@ -0,0 +1,10 @@
+-- Composite index for per-target log history (WHERE target_id = ? ORDER BY executed_at DESC)
+-- Supersedes the single-column target_id index, which is its leading prefix
+-- Migration: 003_report_logs_target_time_index.sql
+-- Date: 2026-10-16
+
+CREATE INDEX IF NOT EXISTS idx_report_logs_target_time ON report_logs(target_id, executed_at DESC);
+
+DROP INDEX IF EXISTS idx_report_logs_target;
+
+INSERT OR IGNORE INTO schema_migrations (version) VALUES ('003_report_logs_target_time_index');
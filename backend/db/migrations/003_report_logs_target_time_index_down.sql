@@ -0,0 +1,7 @@
+-- Rollback script for 003_report_logs_target_time_index.sql
+
+CREATE INDEX IF NOT EXISTS idx_report_logs_target ON report_logs(target_id);
+
+DROP INDEX IF EXISTS idx_report_logs_target_time;
+
+DELETE FROM schema_migrations WHERE version = '003_report_logs_target_time_index';
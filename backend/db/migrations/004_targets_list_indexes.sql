@@ -0,0 +1,15 @@
+-- Composite indexes for the paginated target list (filter by status and/or type, ORDER BY created_at DESC)
+-- Each supersedes an existing index that is its leading prefix
+-- Migration: 004_targets_list_indexes.sql
+-- Date: 2026-10-16
+
+CREATE INDEX IF NOT EXISTS idx_targets_status_created ON targets(status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_targets_type_created ON targets(type, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_targets_status_type_created ON targets(status, type, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_targets_created ON targets(created_at DESC);
+
+DROP INDEX IF EXISTS idx_targets_status;
+DROP INDEX IF EXISTS idx_targets_type;
+DROP INDEX IF EXISTS idx_targets_status_type;
+
+INSERT OR IGNORE INTO schema_migrations (version) VALUES ('004_targets_list_indexes');
@@ -0,0 +1,12 @@
+-- Rollback script for 004_targets_list_indexes.sql
+
+CREATE INDEX IF NOT EXISTS idx_targets_status ON targets(status);
+CREATE INDEX IF NOT EXISTS idx_targets_type ON targets(type);
+CREATE INDEX IF NOT EXISTS idx_targets_status_type ON targets(status, type);
+
+DROP INDEX IF EXISTS idx_targets_status_created;
+DROP INDEX IF EXISTS idx_targets_type_created;
+DROP INDEX IF EXISTS idx_targets_status_type_created;
+DROP INDEX IF EXISTS idx_targets_created;
+
+DELETE FROM schema_migrations WHERE version = '004_targets_list_indexes';
@@ -89,6 +89,7 @@ INSERT OR IGNORE INTO system_config (key, value) VALUES ('autoreply_poll_interva
 INSERT OR IGNORE INTO system_config (key, value) VALUES ('autoreply_poll_min_interval_seconds', '10');
 INSERT OR IGNORE INTO system_config (key, value) VALUES ('autoreply_account_batch_size', '0');
 INSERT OR IGNORE INTO system_config (key, value) VALUES ('autoreply_session_batch_size', '5');
+INSERT OR IGNORE INTO system_config (key, value) VALUES ('autoreply_idle_max_interval_seconds', '0');
 
 -- Auto-reply state (dedup tracking)
 CREATE TABLE IF NOT EXISTS autoreply_state (
@@ -100,14 +101,15 @@ CREATE TABLE IF NOT EXISTS autoreply_state (
 );
 
 -- Indexes for performance
-CREATE INDEX IF NOT EXISTS idx_targets_status ON targets(status);
-CREATE INDEX IF NOT EXISTS idx_targets_type ON targets(type);
-CREATE INDEX IF NOT EXISTS idx_report_logs_target ON report_logs(target_id);
+CREATE INDEX IF NOT EXISTS idx_targets_status_created ON targets(status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_targets_type_created ON targets(type, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_targets_created ON targets(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_report_logs_target_time ON report_logs(target_id, executed_at DESC);
 CREATE INDEX IF NOT EXISTS idx_report_logs_account ON report_logs(account_id);
 CREATE INDEX IF NOT EXISTS idx_accounts_active ON accounts(is_active);
 
 -- 性能优化索引
-CREATE INDEX IF NOT EXISTS idx_targets_status_type ON targets(status, type);
+CREATE INDEX IF NOT EXISTS idx_targets_status_type_created ON targets(status, type, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_report_logs_executed_at ON report_logs(executed_at DESC);
 CREATE INDEX IF NOT EXISTS idx_targets_aid ON targets(aid) WHERE aid IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_targets_type_aid_status ON targets(type, aid, status);
@@ -1,13 +1,20 @@
 """
 Bili-Sentinel Logging Module
 """
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 
 
 def get_logger(name: str = "sentinel") -> logging.Logger:
-    """Get a configured logger instance."""
+    """Get a configured logger instance.
+
+    Records are handed to a QueueHandler and written to stdout by a background
+    QueueListener thread, so logging never blocks the event loop on console I/O.
+    """
     logger = logging.getLogger(name)
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
@@ -17,7 +24,11 @@ def get_logger(name: str = "sentinel") -> logging.Logger:
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
         )
-        logger.addHandler(handler)
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)  # flush queued records on shutdown
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
         level_name = os.getenv("SENTINEL_LOG_LEVEL", "INFO").upper()
         logger.setLevel(getattr(logging, level_name, logging.INFO))
     return logger
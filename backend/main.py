@@ -76,6 +76,21 @@ async def _background_wbi_refresh():
             logger.error("Background WBI refresh error: %s", e)
 
 
+async def _warm_start() -> None:
+    """Prime caches and the shared Bilibili HTTP client so first requests don't pay cold costs."""
+    from backend.core.bilibili_client import get_shared_http_client
+    from backend.database import get_active_accounts_cached
+    from backend.services.config_service import get_all_configs
+
+    await get_all_configs()
+    await get_active_accounts_cached()
+    try:
+        # Resolve DNS and complete the TLS handshake once; the connection stays in the pool
+        await get_shared_http_client().head("https://api.bilibili.com/", timeout=5)
+    except Exception as e:
+        logger.debug("Bilibili connection warm-up failed: %s", e)
+
+
 async def run_migrations() -> None:
     from pathlib import Path
 
@@ -107,11 +122,10 @@ async def lifespan(app: FastAPI):
     await run_migrations()
     logger.info("Database initialized")
     # Recover targets stuck in "processing" from previous crashes
-    from backend.database import execute_query as _eq
-    await _eq("UPDATE targets SET status = 'pending' WHERE status = 'processing'")
-    _stuck = await _eq("SELECT changes() as c")
-    if _stuck and _stuck[0]["c"] > 0:
-        logger.info("Recovered %d stuck targets (processing -> pending)", _stuck[0]["c"])
+    from backend.database import execute_write
+    _stuck = await execute_write("UPDATE targets SET status = 'pending' WHERE status = 'processing'")
+    if _stuck > 0:
+        logger.info("Recovered %d stuck targets (processing -> pending)", _stuck)
     # Refresh WBI keys on startup using the first active account
     from backend.core.bilibili_auth import BilibiliAuth
     from backend.database import execute_query
@@ -127,6 +141,8 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("No active accounts for WBI key refresh")
 
+    await _warm_start()
+
     # Start background WBI refresh task
     import asyncio
     _wbi_task = asyncio.create_task(_background_wbi_refresh())
@@ -142,6 +158,11 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
     stop_scheduler()
+    await reports.stop_report_workers()
+    from backend.services.account_service import close_http_client
+    from backend.core.bilibili_client import close_shared_http_client
+    await close_http_client()
+    await close_shared_http_client()
     await close_db()
     logger.info("Bili-Sentinel shutting down...")
 
@@ -20,6 +20,7 @@ def register_exception_handlers(app: FastAPI):
         return JSONResponse(
             status_code=exc.status_code,
             content=content,
+            headers=getattr(exc, "headers", None),
         )
 
     @app.exception_handler(RequestValidationError)
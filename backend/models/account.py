@@ -62,6 +62,13 @@ class AccountPublic(BaseModel):
         from_attributes = True
 
 
+class AccountListResponse(BaseModel):
+    items: list[AccountPublic]
+    total: int
+    page: int
+    page_size: int
+
+
 class AccountImport(BaseModel):
     """Validated model for account import."""
     name: str = Field(..., min_length=1)
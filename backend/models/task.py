@@ -117,6 +117,13 @@ class AutoReplyConfig(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class AutoReplyConfigListResponse(BaseModel):
+    items: list[AutoReplyConfig]
+    total: int
+    page: int
+    page_size: int
+
+
 class AutoReplyStatus(BaseModel):
     is_running: bool
     active_accounts: int
@@ -1,22 +1,75 @@
 """Account business logic."""
-from backend.database import execute_query, execute_insert, get_active_accounts_cached, invalidate_cache
-from backend.logger import logger
+import json
+from functools import lru_cache
+
+import httpx
+
+from backend.config import HTTP_TIMEOUT
+from backend.core.bilibili_client import format_cookie_header
+from backend.database import execute_in_transaction, execute_query, execute_write, get_active_accounts_cached, get_or_load_cached, invalidate_cache
+from backend.models.account import AccountImport
 
 ALLOWED_UPDATE_FIELDS = {"name", "sessdata", "bili_jct", "buvid3", "buvid4", "dedeuserid_ckmd5", "refresh_token", "group_tag", "is_active"}
 STATUS_RESET_FIELDS = {"sessdata", "bili_jct"}
 _PUBLIC_COLUMNS = "id, name, uid, buvid3, buvid4, group_tag, is_active, last_check_at, status, created_at"
 
+_NAV_URL = "https://api.bilibili.com/x/web-interface/nav"
+_NAV_HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0"}
+
+# Shared client so repeated nav checks reuse pooled connections instead of a new TLS handshake each time.
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(headers=_NAV_HEADERS, timeout=HTTP_TIMEOUT)
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared nav-check client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@lru_cache(maxsize=128)
+def _build_update_sql(fields: tuple[str, ...], reset_status: bool) -> str:
+    """Build the UPDATE statement for a sorted field tuple.
+
+    Keeping the SQL text canonical lets sqlite3's per-connection statement
+    cache reuse the compiled statement across requests.
+    """
+    assignments = [f"{field} = ?" for field in fields]
+    if reset_status:
+        assignments.append("status = 'unknown'")
+        assignments.append("last_check_at = NULL")
+    return f"UPDATE accounts SET {', '.join(assignments)} WHERE id = ? RETURNING *"
+
 
 async def list_accounts(page: int = 1, page_size: int = 50):
-    """List accounts with pagination, excluding credentials."""
-    offset = (page - 1) * page_size
-    items = await execute_query(
-        f"SELECT {_PUBLIC_COLUMNS} FROM accounts ORDER BY created_at DESC LIMIT ? OFFSET ?",
-        (page_size, offset)
-    )
-    count_result = await execute_query("SELECT COUNT(*) as total FROM accounts")
-    total = count_result[0]["total"] if count_result else 0
-    return {"items": items, "total": total, "page": page, "page_size": page_size}
+    """List accounts with pagination, excluding credentials (10s cache)."""
+    async def _load():
+        offset = (page - 1) * page_size
+        items = await execute_query(
+            f"SELECT {_PUBLIC_COLUMNS} FROM accounts ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            (page_size, offset)
+        )
+        count_result = await execute_query("SELECT COUNT(*) as total FROM accounts")
+        total = count_result[0]["total"] if count_result else 0
+        return {"items": items, "total": total, "page": page, "page_size": page_size}
+
+    return await get_or_load_cached(f"accounts_page:{page}:{page_size}", 10, _load)
+
+
+async def list_accounts_json(page: int = 1, page_size: int = 50) -> bytes:
+    """Same as list_accounts, pre-encoded as a JSON body (10s cache)."""
+    async def _load():
+        return json.dumps(await list_accounts(page, page_size), ensure_ascii=False).encode("utf-8")
+
+    return await get_or_load_cached(f"accounts_page_json:{page}:{page_size}", 10, _load)
 
 
 async def get_account(account_id: int):
@@ -37,58 +90,63 @@ async def get_account_public(account_id: int):
 
 
 async def list_accounts_internal():
-    """List all account IDs and names for internal operations."""
-    return await execute_query("SELECT id, name FROM accounts ORDER BY created_at DESC")
+    """List all account rows (including credentials) for internal operations."""
+    return await execute_query("SELECT * FROM accounts ORDER BY created_at DESC")
 
 
 async def create_account(name, sessdata, bili_jct, buvid3="", buvid4="", dedeuserid_ckmd5="", group_tag="default"):
-    account_id = await execute_insert(
-        "INSERT INTO accounts (name, sessdata, bili_jct, buvid3, buvid4, dedeuserid_ckmd5, group_tag) VALUES (?, ?, ?, ?, ?, ?, ?)",
+    rows = await execute_query(
+        "INSERT INTO accounts (name, sessdata, bili_jct, buvid3, buvid4, dedeuserid_ckmd5, group_tag) VALUES (?, ?, ?, ?, ?, ?, ?) RETURNING *",
         (name, sessdata, bili_jct, buvid3, buvid4, dedeuserid_ckmd5, group_tag)
     )
-    await invalidate_cache("active_accounts")
-    rows = await execute_query("SELECT * FROM accounts WHERE id = ?", (account_id,))
+    await invalidate_cache("accounts")
     return rows[0]
 
 
 async def update_account(account_id: int, fields: dict):
-    existing_rows = await execute_query("SELECT * FROM accounts WHERE id = ?", (account_id,))
-    if not existing_rows:
-        return None
-    existing = existing_rows[0]
-
-    updates, params = [], []
-    should_reset_status = False
-    for field, value in fields.items():
-        if value is not None and field in ALLOWED_UPDATE_FIELDS:
-            updates.append(f"{field} = ?")
-            params.append(value)
-            if (field in STATUS_RESET_FIELDS or field.startswith("buvid")) and existing.get(field) != value:
-                should_reset_status = True
-    if not updates:
-        return "no_valid_fields"
-    if should_reset_status:
-        updates.append("status = ?")
-        params.append("unknown")
-        updates.append("last_check_at = NULL")
+    present = sorted(
+        field for field, value in fields.items()
+        if value is not None and field in ALLOWED_UPDATE_FIELDS
+    )
+    params = [fields[field] for field in present]
     params.append(account_id)
-    await execute_query(f"UPDATE accounts SET {', '.join(updates)} WHERE id = ?", tuple(params))
-    await invalidate_cache("active_accounts")
-    rows = await execute_query("SELECT * FROM accounts WHERE id = ?", (account_id,))
-    return rows[0] if rows else None
+
+    async def _operation(conn):
+        cursor = await conn.execute("SELECT * FROM accounts WHERE id = ?", (account_id,))
+        existing = await cursor.fetchone()
+        if existing is None:
+            return None
+        if not present:
+            return "no_valid_fields"
+        should_reset_status = any(
+            (field in STATUS_RESET_FIELDS or field.startswith("buvid")) and existing[field] != fields[field]
+            for field in present
+        )
+        # UPDATE ... RETURNING folds the write and the read-back into one statement
+        cursor = await conn.execute(_build_update_sql(tuple(present), should_reset_status), tuple(params))
+        rows = await cursor.fetchall()
+        return dict(rows[0]) if rows else None
+
+    result = await execute_in_transaction(_operation)
+    if isinstance(result, dict):
+        await invalidate_cache("accounts")
+    return result
 
 
 async def delete_account(account_id: int):
-    rows = await execute_query("SELECT * FROM accounts WHERE id = ?", (account_id,))
-    if not rows:
+    if not await execute_write("DELETE FROM accounts WHERE id = ?", (account_id,)):
         return False
-    await execute_query("DELETE FROM accounts WHERE id = ?", (account_id,))
-    await invalidate_cache("active_accounts")
+    await invalidate_cache("accounts")
     return True
 
 
-async def get_active_accounts():
-    return await get_active_accounts_cached()
+async def get_active_accounts(account_ids: list[int] | None = None):
+    """Active, valid accounts from the 60s cache, optionally restricted to `account_ids`."""
+    accounts = await get_active_accounts_cached()
+    if account_ids:
+        wanted = set(account_ids)
+        accounts = [account for account in accounts if account["id"] in wanted]
+    return accounts
 
 
 async def export_accounts(include_credentials: bool = False):
@@ -100,40 +158,45 @@ async def export_accounts(include_credentials: bool = False):
     return rows
 
 
-async def import_accounts(accounts_data: list[dict]) -> dict:
-    """Batch import accounts from JSON array. Returns count of created/skipped."""
+async def import_accounts(accounts: list[AccountImport]) -> dict:
+    """Batch import accounts in one transaction. Returns count of created/skipped."""
+    rows = [
+        (acc.name, acc.sessdata, acc.bili_jct, acc.buvid3 or "", acc.buvid4 or "",
+         acc.dedeuserid_ckmd5 or "", acc.group_tag or "default")
+        for acc in accounts
+        if acc.name and acc.sessdata and acc.bili_jct
+    ]
     created = 0
-    skipped = 0
-    for acc in accounts_data:
-        name = acc.get("name")
-        sessdata = acc.get("sessdata")
-        bili_jct = acc.get("bili_jct")
-        if not name or not sessdata or not bili_jct:
-            skipped += 1
-            continue
-        try:
-            await create_account(
-                name=name,
-                sessdata=sessdata,
-                bili_jct=bili_jct,
-                buvid3=acc.get("buvid3", ""),
-                buvid4=acc.get("buvid4", ""),
-                dedeuserid_ckmd5=acc.get("dedeuserid_ckmd5", ""),
-                group_tag=acc.get("group_tag", "default"),
-            )
-            created += 1
-        except Exception as e:
-            logger.warning("Import account '%s' failed: %s", name, e)
-            skipped += 1
-    return {"created": created, "skipped": skipped, "total": len(accounts_data)}
-
-
-async def check_account_validity(account_id: int):
-    import httpx
-    rows = await execute_query("SELECT * FROM accounts WHERE id = ?", (account_id,))
-    if not rows:
-        return None
-    account = rows[0]
+    if rows:
+        async def _operation(conn) -> int:
+            inserted = 0
+            for row in rows:
+                # OR IGNORE skips a row that violates a constraint without aborting the rest
+                cursor = await conn.execute(
+                    "INSERT OR IGNORE INTO accounts (name, sessdata, bili_jct, buvid3, buvid4, dedeuserid_ckmd5, group_tag) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) RETURNING id",
+                    row,
+                )
+                if await cursor.fetchone():
+                    inserted += 1
+            return inserted
+
+        created = await execute_in_transaction(_operation)
+        await invalidate_cache("accounts")
+    return {"created": created, "skipped": len(accounts) - created, "total": len(accounts)}
+
+
+async def check_account_validity(account_id: int, account: dict | None = None):
+    """Check an account's cookies against the nav API.
+
+    Callers that already hold the full account row can pass it to skip the lookup.
+    """
+    if account is None:
+        rows = await execute_query("SELECT * FROM accounts WHERE id = ?", (account_id,))
+        if not rows:
+            return None
+        account = rows[0]
+
     cookies = {
         "SESSDATA": account["sessdata"],
         "bili_jct": account["bili_jct"],
@@ -141,18 +204,17 @@ async def check_account_validity(account_id: int):
     }
     if account.get("buvid4"):
         cookies["buvid4"] = account["buvid4"]
-    async with httpx.AsyncClient(cookies=cookies) as client:
-        resp = await client.get("https://api.bilibili.com/x/web-interface/nav",
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0"})
-        data = resp.json()
+    # Cookies go in an explicit header: the client is shared, so its jar must not carry state between accounts.
+    resp = await _get_http_client().get(_NAV_URL, headers={"Cookie": format_cookie_header(cookies)})
+    data = resp.json()
     is_valid = data.get("code") == 0
     uid = data.get("data", {}).get("mid") if is_valid else None
     status = "valid" if is_valid else "invalid"
     await execute_query("UPDATE accounts SET status = ?, uid = ?, last_check_at = strftime('%Y-%m-%dT%H:%M:%fZ','now') WHERE id = ?",
         (status, uid, account_id))
-    await invalidate_cache("active_accounts")
+    await invalidate_cache("accounts")
     return {"id": account_id, "name": account["name"], "status": status, "is_valid": is_valid, "uid": uid}
 
 
-async def check_account_health(account_id: int):
-    return await check_account_validity(account_id)
+async def check_account_health(account_id: int, account_row: dict | None = None):
+    return await check_account_validity(account_id, account_row)
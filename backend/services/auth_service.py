@@ -141,7 +141,7 @@ async def qr_login_save(qrcode_key: str, account_name: str) -> dict:
                    WHERE id = ?""",
                 (sessdata, bili_jct, ckmd5, refresh_token, account_name, account_id),
             )
-            await invalidate_cache("active_accounts")
+            await invalidate_cache("accounts")
             # Fetch buvid cookies
             buvid = await _fetch_buvid(sessdata, bili_jct)
             if buvid["buvid3"] or buvid["buvid4"]:
@@ -149,6 +149,7 @@ async def qr_login_save(qrcode_key: str, account_name: str) -> dict:
                     "UPDATE accounts SET buvid3 = ?, buvid4 = ? WHERE id = ?",
                     (buvid["buvid3"], buvid["buvid4"], account_id),
                 )
+                await invalidate_cache("accounts")
             logger.info("[Auth] QR login updated existing account %d (uid=%s)", account_id, uid)
             rows = await execute_query("SELECT * FROM accounts WHERE id = ?", (account_id,))
             safe_account = {k: v for k, v in rows[0].items() if k not in _SENSITIVE_FIELDS}
@@ -166,7 +167,7 @@ async def qr_login_save(qrcode_key: str, account_name: str) -> dict:
             "UPDATE accounts SET uid = ?, refresh_token = ?, status = 'valid', last_check_at = strftime('%Y-%m-%dT%H:%M:%fZ','now') WHERE id = ?",
             (uid, refresh_token, account["id"]),
         )
-        await invalidate_cache("active_accounts")
+        await invalidate_cache("accounts")
     # Fetch buvid cookies
     buvid = await _fetch_buvid(sessdata, bili_jct)
     if buvid["buvid3"] or buvid["buvid4"]:
@@ -174,6 +175,7 @@ async def qr_login_save(qrcode_key: str, account_name: str) -> dict:
             "UPDATE accounts SET buvid3 = ?, buvid4 = ? WHERE id = ?",
             (buvid["buvid3"], buvid["buvid4"], account["id"]),
         )
+        await invalidate_cache("accounts")
     logger.info("[Auth] QR login created account %d (uid=%s)", account["id"], uid)
     rows = await execute_query("SELECT * FROM accounts WHERE id = ?", (account["id"],))
     safe_account = {k: v for k, v in rows[0].items() if k not in _SENSITIVE_FIELDS}
@@ -301,7 +303,7 @@ async def refresh_account_cookies(account_id: int) -> dict:
                    status = 'valid', last_check_at = strftime('%Y-%m-%dT%H:%M:%fZ','now') WHERE id = ?""",
                 (new_sessdata, new_bili_jct, new_refresh_token, account_id),
             )
-            await invalidate_cache("active_accounts")
+            await invalidate_cache("accounts")
             logger.info("[Auth] Cookies refreshed for account %d", account_id)
             return {"success": True, "message": "Cookies refreshed successfully"}
 
@@ -3,9 +3,11 @@
 import asyncio
 from collections.abc import Awaitable, Callable
 import json
+import re
 from typing import Optional, TypedDict
 
-from backend.database import execute_insert, execute_query
+from backend.config import AUTOREPLY_ACCOUNT_CONCURRENCY
+from backend.database import execute_in_transaction, execute_query, get_or_load_cached
 from backend.logger import logger
 
 ACTIVE_AUTOREPLY_CONFIGS_QUERY = (
@@ -17,6 +19,8 @@ STANDALONE_AUTOREPLY_ACCOUNTS_QUERY = "SELECT * FROM accounts WHERE is_active =
 SCHEDULER_AUTOREPLY_ACCOUNTS_QUERY = (
     "SELECT * FROM accounts WHERE is_active = 1 AND status IN ('valid', 'expiring')"
 )
+# Prefix of every cached view of autoreply_config; config writes invalidate all of them
+AUTOREPLY_CONFIGS_CACHE_KEY = "autoreply_configs"
 FALLBACK_AUTOREPLY_TEXT = "您好，稍后回复。"
 AUTOREPLY_SEND_DELAY = 3.0  # seconds between replies to avoid B站 rate limiting
 
@@ -31,23 +35,50 @@ class AutoReplyConfig(TypedDict):
     is_active: int
 
 
-def match_reply_rule(msg_content: str, configs: list[AutoReplyConfig]) -> str:
-    """Match first keyword rule in configured order; fallback to default reply."""
-    default_reply = FALLBACK_AUTOREPLY_TEXT
+def build_reply_matcher(configs: list[AutoReplyConfig]) -> Callable[[str], str]:
+    """Precompile configs into a matcher: first keyword rule in configured order wins, else default reply."""
+    rules: list[tuple[str, str]] = []
     first_default = None
-
-    # Single pass: match keywords and capture first default
     for config in configs:
         keyword = config["keyword"]
         if keyword is None:
             if first_default is None:
                 first_default = config["response"]
             continue
-        if keyword and keyword in msg_content:
-            return config["response"]
+        # A rule whose keyword contains an earlier keyword can never win, so it is not scanned
+        if keyword and not any(earlier in keyword for earlier, _ in rules):
+            rules.append((keyword, config["response"]))
+
+    default_reply = first_default if first_default is not None else FALLBACK_AUTOREPLY_TEXT
+    compiled = tuple(rules)
+    if not compiled:
+        return lambda msg_content: default_reply
+    # One C-level pass answers "does any keyword occur?"; most messages hit none and stop here.
+    # The regex only prefilters: alternation picks the leftmost match, not the highest-priority rule.
+    contains_keyword = re.compile("|".join(re.escape(keyword) for keyword, _ in compiled)).search
+
+    def match(msg_content: str) -> str:
+        if not contains_keyword(msg_content):
+            return default_reply
+        for keyword, response in compiled:
+            if keyword in msg_content:
+                return response
+        return default_reply
+
+    return match
+
+
+async def load_reply_matcher() -> Callable[[str], str]:
+    """Matcher over the active configs, cached for 30s or until a config write invalidates it."""
+    async def _load():
+        return build_reply_matcher(await execute_query(ACTIVE_AUTOREPLY_CONFIGS_QUERY))
 
-    # Use captured default or fallback
-    return first_default if first_default is not None else default_reply
+    return await get_or_load_cached(f"{AUTOREPLY_CONFIGS_CACHE_KEY}:matcher", 30, _load)
+
+
+def match_reply_rule(msg_content: str, configs: list[AutoReplyConfig]) -> str:
+    """Match first keyword rule in configured order; fallback to default reply."""
+    return build_reply_matcher(configs)(msg_content)
 
 
 def _apply_batch_limit(items: list, limit: int) -> list:
@@ -56,96 +87,143 @@ def _apply_batch_limit(items: list, limit: int) -> list:
     return items[:limit]
 
 
+async def _poll_account(
+    account: dict,
+    match_reply: Callable[[str], str],
+    on_reply_sent: ReplySentCallback | None,
+    session_batch_size: int,
+) -> int:
+    """Reply to new private messages for a single account; returns how many new messages were seen."""
+    from backend.core.bilibili_auth import BilibiliAuth
+    from backend.core.bilibili_client import BilibiliClient, get_shared_http_client
+
+    try:
+        own_uid = int(account.get("uid") or 0)
+    except (TypeError, ValueError):
+        own_uid = 0
+    if not own_uid:
+        logger.warning("[AutoReply][%s] Account has no UID, skipping", account.get("name", "?"))
+        return 0
+
+    auth = BilibiliAuth.from_db_account(account)
+    async with BilibiliClient(auth, account_index=0, client=get_shared_http_client()) as client:
+        sessions = await client.get_recent_sessions()
+        if sessions.get("code") != 0:
+            return 0
+
+        session_list = sessions.get("data", {}).get("session_list", []) or []
+        candidates = []
+        for session in _apply_batch_limit(session_list, session_batch_size):
+            last_msg = session.get("last_msg", {})
+            talker_id = session.get("talker_id")
+            # Compare as ints: own_uid is coerced once above, no per-session str() churn
+            try:
+                talker_uid = int(talker_id)
+                if talker_uid == own_uid:
+                    continue
+                # Skip if last message was sent by ourselves (avoid reply loop)
+                if int(last_msg.get("sender_uid") or 0) == own_uid:
+                    continue
+            except (TypeError, ValueError):
+                continue
+            candidates.append((talker_uid, talker_id, last_msg))
+        if not candidates:
+            return 0
+
+        # One lookup for every talker's reply state instead of a SELECT per session
+        state_rows = await execute_query(
+            "SELECT talker_id, last_msg_ts FROM autoreply_state "
+            "WHERE account_id = ? AND talker_id IN (SELECT value FROM json_each(?))",
+            (account["id"], json.dumps([talker_uid for talker_uid, _, _ in candidates])),
+        )
+        last_replied = {row["talker_id"]: row["last_msg_ts"] for row in state_rows}
+
+        new_messages = 0
+        for talker_uid, talker_id, last_msg in candidates:
+            msg_ts = last_msg.get("timestamp", 0)
+            if msg_ts <= last_replied.get(talker_uid, 0):
+                continue
+            new_messages += 1
+
+            msg_content = str(last_msg.get("content", ""))
+            reply_text = match_reply(msg_content)
+
+            logger.info("[AutoReply][%s] Replying to %s: %s", account["name"], talker_id, reply_text)
+            send_result = await client.send_private_message(talker_id, reply_text)
+            send_success = send_result.get("code") == 0
+
+            log_row = (
+                None,
+                account["id"],
+                "autoreply",
+                json.dumps({"talker_id": talker_id, "reply": reply_text}),
+                json.dumps(send_result),
+                send_success,
+                None if send_success else send_result.get("message", "Unknown error"),
+            )
+
+            # Log the reply and always advance autoreply_state (avoids retry loops on
+            # persistent failures) in one transaction: one lock acquisition, one commit.
+            async def _record(conn):
+                await conn.execute(
+                    """INSERT INTO report_logs (
+                           target_id, account_id, action, request_data, response_data, success, error_message, executed_at
+                       )
+                       VALUES (?, ?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%fZ','now'))""",
+                    log_row,
+                )
+                await conn.execute(
+                    "INSERT INTO autoreply_state (account_id, talker_id, last_msg_ts) VALUES (?, ?, ?) "
+                    "ON CONFLICT(account_id, talker_id) DO UPDATE SET last_msg_ts = excluded.last_msg_ts",
+                    (account["id"], talker_id, msg_ts),
+                )
+
+            await execute_in_transaction(_record)
+            last_replied[talker_uid] = msg_ts
+
+            if not send_success:
+                send_code = send_result.get("code")
+                # Rate limited by B站 — stop processing this account entirely
+                if send_code == 21046:
+                    logger.warning("[AutoReply][%s] Rate limited (21046), skipping remaining sessions", account["name"])
+                    break
+                continue
+
+            if on_reply_sent:
+                await on_reply_sent(account, talker_id, reply_text, send_result)
+
+            # Delay between replies to avoid B站 rate limiting
+            await asyncio.sleep(AUTOREPLY_SEND_DELAY)
+
+    return new_messages
+
+
 async def run_autoreply_poll_cycle(
     account_query: str,
     on_reply_sent: ReplySentCallback | None = None,
     account_batch_size: int = 0,
     session_batch_size: int = 0,
-) -> None:
-    """Run one auto-reply polling cycle for the given account query."""
-    from backend.core.bilibili_auth import BilibiliAuth
-    from backend.core.bilibili_client import BilibiliClient
-
+) -> int:
+    """Run one auto-reply polling cycle for the given account query; returns the number of new messages."""
     accounts = await execute_query(account_query)
-    configs = await execute_query(ACTIVE_AUTOREPLY_CONFIGS_QUERY)
-
-    for account in _apply_batch_limit(accounts, account_batch_size):
-        try:
-            own_uid = account.get("uid")
-            if not own_uid:
-                logger.warning("[AutoReply][%s] Account has no UID, skipping", account.get("name", "?"))
-                continue
-
-            auth = BilibiliAuth.from_db_account(account)
-            async with BilibiliClient(auth, account_index=0) as client:
-                sessions = await client.get_recent_sessions()
-                if sessions.get("code") != 0:
-                    continue
-
-                session_list = sessions.get("data", {}).get("session_list", []) or []
-                for session in _apply_batch_limit(session_list, session_batch_size):
-                    last_msg = session.get("last_msg", {})
-                    msg_ts = last_msg.get("timestamp", 0)
-
-                    talker_id = session.get("talker_id")
-                    if str(talker_id) == str(own_uid):
-                        continue
-
-                    # Skip if last message was sent by ourselves (avoid reply loop)
-                    sender_uid = last_msg.get("sender_uid", 0)
-                    if str(sender_uid) == str(own_uid):
-                        continue
-
-                    state_rows = await execute_query(
-                        "SELECT last_msg_ts FROM autoreply_state WHERE account_id = ? AND talker_id = ?",
-                        (account["id"], talker_id),
-                    )
-                    last_replied_ts = state_rows[0]["last_msg_ts"] if state_rows else 0
-                    if msg_ts <= last_replied_ts:
-                        continue
-
-                    msg_content = str(last_msg.get("content", ""))
-                    reply_text = match_reply_rule(msg_content, configs)
-
-                    logger.info("[AutoReply][%s] Replying to %s: %s", account["name"], talker_id, reply_text)
-                    send_result = await client.send_private_message(talker_id, reply_text)
-                    send_success = send_result.get("code") == 0
-
-                    await execute_insert(
-                        """INSERT INTO report_logs (
-                               target_id, account_id, action, request_data, response_data, success, error_message, executed_at
-                           )
-                           VALUES (?, ?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%fZ','now'))""",
-                        (
-                            None,
-                            account["id"],
-                            "autoreply",
-                            json.dumps({"talker_id": talker_id, "reply": reply_text}),
-                            json.dumps(send_result),
-                            send_success,
-                            None if send_success else send_result.get("message", "Unknown error"),
-                        ),
-                    )
-
-                    # Always update autoreply_state to avoid retry loops on persistent failures
-                    await execute_query(
-                        "INSERT INTO autoreply_state (account_id, talker_id, last_msg_ts) VALUES (?, ?, ?) "
-                        "ON CONFLICT(account_id, talker_id) DO UPDATE SET last_msg_ts = excluded.last_msg_ts",
-                        (account["id"], talker_id, msg_ts),
-                    )
-
-                    if not send_success:
-                        send_code = send_result.get("code")
-                        # Rate limited by B站 — stop processing this account entirely
-                        if send_code == 21046:
-                            logger.warning("[AutoReply][%s] Rate limited (21046), skipping remaining sessions", account["name"])
-                            break
-                        continue
-
-                    if on_reply_sent:
-                        await on_reply_sent(account, talker_id, reply_text, send_result)
-
-                    # Delay between replies to avoid B站 rate limiting
-                    await asyncio.sleep(AUTOREPLY_SEND_DELAY)
-        except Exception as acc_err:
-            logger.error("[AutoReply][%s] Error: %s", account.get("name", "?"), acc_err)
+    # Shared by every account/session below; only rebuilt after configs change
+    match_reply = await load_reply_matcher()
+
+    # Accounts are independent; a fixed set of workers drains them so at most
+    # AUTOREPLY_ACCOUNT_CONCURRENCY tasks exist however many accounts there are,
+    # and a slow account only occupies one worker while the others move on.
+    accounts = _apply_batch_limit(accounts, account_batch_size)
+    pending = iter(accounts)
+
+    async def _worker() -> int:
+        seen = 0
+        for account in pending:
+            try:
+                seen += await _poll_account(account, match_reply, on_reply_sent, session_batch_size)
+            except Exception as acc_err:
+                logger.error("[AutoReply][%s] Error: %s", account.get("name", "?"), acc_err)
+        return seen
+
+    workers = min(AUTOREPLY_ACCOUNT_CONCURRENCY, len(accounts))
+    counts = await asyncio.gather(*(_worker() for _ in range(workers)))
+    return sum(counts)
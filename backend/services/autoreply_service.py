@@ -1,17 +1,28 @@
 """Auto-reply business logic."""
 import asyncio
+import json
+import random
 from datetime import datetime, timezone
+from itertools import combinations
 
 from backend.config import (
     AUTOREPLY_ACCOUNT_BATCH_SIZE,
+    AUTOREPLY_IDLE_MAX_INTERVAL_SECONDS,
     AUTOREPLY_POLL_INTERVAL_SECONDS,
     AUTOREPLY_POLL_MIN_INTERVAL_SECONDS,
     AUTOREPLY_SESSION_BATCH_SIZE,
 )
-from backend.database import execute_in_transaction, execute_query, execute_insert
+from backend.database import (
+    execute_in_transaction,
+    execute_query,
+    execute_write,
+    get_or_load_cached,
+    invalidate_cache,
+)
 from backend.logger import logger
 from backend.services.autoreply_polling import (
     ACTIVE_AUTOREPLY_CONFIGS_QUERY,
+    AUTOREPLY_CONFIGS_CACHE_KEY,
     STANDALONE_AUTOREPLY_ACCOUNTS_QUERY,
     match_reply_rule,
     run_autoreply_poll_cycle,
@@ -32,6 +43,7 @@ AUTOREPLY_POLL_INTERVAL_KEY = "autoreply_poll_interval_seconds"
 AUTOREPLY_POLL_MIN_INTERVAL_KEY = "autoreply_poll_min_interval_seconds"
 AUTOREPLY_ACCOUNT_BATCH_SIZE_KEY = "autoreply_account_batch_size"
 AUTOREPLY_SESSION_BATCH_SIZE_KEY = "autoreply_session_batch_size"
+AUTOREPLY_IDLE_MAX_INTERVAL_KEY = "autoreply_idle_max_interval_seconds"
 
 
 def _utc_now_iso() -> str:
@@ -74,37 +86,84 @@ async def _resolve_poll_settings(startup_interval: int | None = None) -> dict[st
         session_batch_size = max(
             _coerce_int(session_batch_raw, AUTOREPLY_SESSION_BATCH_SIZE), 0
         )
+
+        idle_max_raw = await get_config(AUTOREPLY_IDLE_MAX_INTERVAL_KEY)
+        idle_max_interval = max(
+            _coerce_int(idle_max_raw, AUTOREPLY_IDLE_MAX_INTERVAL_SECONDS), 0
+        )
     except Exception as config_err:
         logger.warning("Failed to load auto-reply poll settings: %s", config_err)
         min_interval = AUTOREPLY_POLL_MIN_INTERVAL_SECONDS
         poll_interval = max(interval_fallback, min_interval)
         account_batch_size = AUTOREPLY_ACCOUNT_BATCH_SIZE
         session_batch_size = AUTOREPLY_SESSION_BATCH_SIZE
+        idle_max_interval = AUTOREPLY_IDLE_MAX_INTERVAL_SECONDS
 
     return {
         "poll_interval_seconds": poll_interval,
         "account_batch_size": account_batch_size,
         "session_batch_size": session_batch_size,
+        "idle_max_interval_seconds": idle_max_interval,
     }
 
 
+def _next_poll_delay(poll_interval: int, idle_max_interval: int, idle_cycles: int) -> float:
+    """Double the delay per consecutive idle cycle up to idle_max_interval, with ±10% jitter."""
+    if idle_cycles <= 0 or idle_max_interval <= poll_interval:
+        return poll_interval
+    delay = min(poll_interval * 2 ** min(idle_cycles, 16), idle_max_interval)
+    return delay * random.uniform(0.9, 1.1)
+
+
 # ── CRUD ──────────────────────────────────────────────────────────────────
 
 async def list_configs():
-    return await execute_query(
-        "SELECT * FROM autoreply_config ORDER BY priority DESC, id ASC"
+    return await get_or_load_cached(
+        AUTOREPLY_CONFIGS_CACHE_KEY,
+        30,
+        lambda: execute_query("SELECT * FROM autoreply_config ORDER BY priority DESC, id ASC"),
     )
 
 
+async def list_configs_json() -> bytes:
+    """Same as list_configs, pre-encoded as a JSON body (30s cache)."""
+    async def _load():
+        return json.dumps(await list_configs(), ensure_ascii=False).encode("utf-8")
+
+    return await get_or_load_cached(f"{AUTOREPLY_CONFIGS_CACHE_KEY}:json", 30, _load)
+
+
+async def count_configs() -> int:
+    """Total number of auto-reply configs (60s cache)."""
+    async def _load():
+        rows = await execute_query("SELECT COUNT(*) as total FROM autoreply_config")
+        return {"total": rows[0]["total"] if rows else 0}
+
+    return (await get_or_load_cached(f"{AUTOREPLY_CONFIGS_CACHE_KEY}:count", 60, _load))["total"]
+
+
+async def list_configs_page_json(page: int, page_size: int) -> bytes:
+    """One page of configs with LIMIT/OFFSET pushed into SQL, pre-encoded as JSON (30s cache)."""
+    async def _load():
+        items = await execute_query(
+            "SELECT * FROM autoreply_config ORDER BY priority DESC, id ASC LIMIT ? OFFSET ?",
+            (page_size, (page - 1) * page_size),
+        )
+        body = {"items": items, "total": await count_configs(), "page": page, "page_size": page_size}
+        return json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+    return await get_or_load_cached(f"{AUTOREPLY_CONFIGS_CACHE_KEY}:page:{page}:{page_size}", 30, _load)
+
+
 async def create_config(keyword, response, priority=0):
     if keyword is None:
         return await upsert_default_reply(response=response, priority=priority)
 
-    config_id = await execute_insert(
-        "INSERT INTO autoreply_config (keyword, response, priority) VALUES (?, ?, ?)",
+    rows = await execute_query(
+        "INSERT INTO autoreply_config (keyword, response, priority) VALUES (?, ?, ?) RETURNING *",
         (keyword, response, priority),
     )
-    rows = await execute_query("SELECT * FROM autoreply_config WHERE id = ?", (config_id,))
+    await invalidate_cache(AUTOREPLY_CONFIGS_CACHE_KEY)
     return rows[0]
 
 
@@ -139,31 +198,49 @@ async def upsert_default_reply(response: str, priority: int = -1):
         row = await row_cursor.fetchone()
         return dict(row)
 
-    return await execute_in_transaction(_operation)
+    result = await execute_in_transaction(_operation)
+    await invalidate_cache(AUTOREPLY_CONFIGS_CACHE_KEY)
+    return result
+
+
+def _build_update_sql(fields: tuple[str, ...]) -> str:
+    return f"UPDATE autoreply_config SET {', '.join(f'{f} = ?' for f in fields)} WHERE id = ? RETURNING *"
+
+
+# Every (sorted) non-empty subset of the updatable fields -> its UPDATE statement,
+# built once at import (2^4 - 1 entries) so requests only do a dict lookup.
+_UPDATE_SQL: dict[tuple[str, ...], str] = {
+    fields: _build_update_sql(fields)
+    for size in range(1, len(ALLOWED_UPDATE_FIELDS) + 1)
+    for fields in combinations(sorted(ALLOWED_UPDATE_FIELDS), size)
+}
 
 
 async def update_config(config_id: int, fields: dict):
-    updates = []
-    params = []
-    for field, value in fields.items():
-        if value is not None and field in ALLOWED_UPDATE_FIELDS:
-            updates.append(f"{field} = ?")
-            params.append(value)
-    if not updates:
-        return "no_valid_fields"
-    params.append(config_id)
-    await execute_query(
-        f"UPDATE autoreply_config SET {', '.join(updates)} WHERE id = ?", tuple(params)
+    present = sorted(
+        field for field, value in fields.items()
+        if value is not None and field in ALLOWED_UPDATE_FIELDS
     )
-    rows = await execute_query("SELECT * FROM autoreply_config WHERE id = ?", (config_id,))
-    return rows[0] if rows else None
+    if not present:
+        return "no_valid_fields"
+    params = [fields[f] for f in present] + [config_id]
+
+    async def _operation(conn):
+        # UPDATE ... RETURNING: existence check, write and read-back in one statement
+        cursor = await conn.execute(_UPDATE_SQL[tuple(present)], tuple(params))
+        rows = await cursor.fetchall()
+        return dict(rows[0]) if rows else None
+
+    result = await execute_in_transaction(_operation)
+    if result is not None:
+        await invalidate_cache(AUTOREPLY_CONFIGS_CACHE_KEY)
+    return result
 
 
 async def delete_config(config_id: int) -> bool:
-    rows = await execute_query("SELECT * FROM autoreply_config WHERE id = ?", (config_id,))
-    if not rows:
+    if not await execute_write("DELETE FROM autoreply_config WHERE id = ?", (config_id,)):
         return False
-    await execute_query("DELETE FROM autoreply_config WHERE id = ?", (config_id,))
+    await invalidate_cache(AUTOREPLY_CONFIGS_CACHE_KEY)
     return True
 
 
@@ -216,6 +293,7 @@ async def start_service(interval: int = AUTOREPLY_POLL_INTERVAL_SECONDS):
     async def poll_loop():
         global _last_poll_at
 
+        idle_cycles = 0
         while _autoreply_running:
             settings = await _resolve_poll_settings(startup_interval=interval)
             poll_interval = settings["poll_interval_seconds"]
@@ -224,15 +302,19 @@ async def start_service(interval: int = AUTOREPLY_POLL_INTERVAL_SECONDS):
 
             try:
                 _last_poll_at = _utc_now_iso()
-                await run_autoreply_poll_cycle(
+                new_messages = await run_autoreply_poll_cycle(
                     account_query=STANDALONE_AUTOREPLY_ACCOUNTS_QUERY,
                     account_batch_size=account_batch_size,
                     session_batch_size=session_batch_size,
                 )
+                idle_cycles = 0 if new_messages else idle_cycles + 1
             except Exception as e:
                 logger.error("Auto-reply error: %s", e)
+                idle_cycles = 0
 
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(
+                _next_poll_delay(poll_interval, settings["idle_max_interval_seconds"], idle_cycles)
+            )
 
     _autoreply_task = asyncio.create_task(poll_loop())
     return True
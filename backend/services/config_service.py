@@ -1,7 +1,7 @@
 """System Configuration Service"""
 import json
 import math
-from backend.database import execute_query, get_all_configs_cached, invalidate_cache, execute_in_transaction
+from backend.database import execute_query, get_all_configs_cached, get_or_load_cached, invalidate_cache, execute_in_transaction
 from backend.logger import logger
 
 
@@ -32,7 +32,7 @@ def _validate_config(key: str, value):
         v = int(value)
         if v < 1:
             raise ValueError(f"{key} must be >= 1")
-    elif key in ("autoreply_account_batch_size", "autoreply_session_batch_size"):
+    elif key in ("autoreply_account_batch_size", "autoreply_session_batch_size", "autoreply_idle_max_interval_seconds"):
         v = int(value)
         if v < 0:
             raise ValueError(f"{key} must be >= 0")
@@ -49,17 +49,16 @@ async def _invalidate_config_related_caches():
 
 
 async def get_config(key: str):
-    """Get a config value by key."""
-    rows = await execute_query(
-        "SELECT value FROM system_config WHERE key = ?", (key,)
-    )
-    if not rows:
-        return None
-    raw = rows[0]["value"]
-    try:
-        return json.loads(raw)
-    except (json.JSONDecodeError, TypeError):
-        return raw
+    """Get a config value by key (served from the cached config table)."""
+    for row in await get_all_configs_cached():
+        if row["key"] != key:
+            continue
+        raw = row["value"]
+        try:
+            return json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            return raw
+    return None
 
 
 async def set_config(key: str, value):
@@ -86,15 +85,15 @@ async def set_configs_batch_atomic(configs: dict):
         except (TypeError, ValueError, OverflowError) as e:
             raise ValueError(f"Validation failed for '{key}': {str(e)}")
 
-    # Write all in transaction
+    rows = [(key, json.dumps(value)) for key, value in configs.items()]
+
+    # Write all in one transaction with a single executemany call
     async def _write_all(conn):
-        for key, value in configs.items():
-            serialized = json.dumps(value)
-            await conn.execute(
-                "INSERT INTO system_config (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP) "
-                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
-                (key, serialized)
-            )
+        await conn.executemany(
+            "INSERT INTO system_config (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+            rows,
+        )
 
     await execute_in_transaction(_write_all)
     await _invalidate_config_related_caches()
@@ -111,3 +110,11 @@ async def get_all_configs():
         except (json.JSONDecodeError, TypeError):
             result[row["key"]] = raw
     return result
+
+
+async def get_all_configs_json() -> bytes:
+    """Same as get_all_configs, pre-encoded as a JSON body (shares the 300s config cache lifetime)."""
+    async def _load():
+        return json.dumps(await get_all_configs(), ensure_ascii=False).encode("utf-8")
+
+    return await get_or_load_cached("all_configs:json", 300, _load)
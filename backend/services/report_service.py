@@ -3,15 +3,21 @@ import json
 import asyncio
 import random
 import time
+from functools import lru_cache
 
+from pydantic import TypeAdapter
+
+from backend.config import REPORT_BATCH_CONCURRENCY
 from backend.database import execute_query, execute_insert, execute_in_transaction
 from backend.core.bilibili_client import _human_delay
 from backend.logger import logger
+from backend.models.report import ReportLog
 from backend.services.config_service import get_all_configs
 from backend.services import target_service
 
 # Track last report time per account for cooldown
 _account_last_report: dict[int, float] = {}
+_REPORT_LOGS_ADAPTER = TypeAdapter(list[ReportLog])
 _cooldown_lock = asyncio.Lock()
 
 # Two-layer config cache strategy:
@@ -64,44 +70,120 @@ async def _cleanup_stale_cooldowns():
         logger.debug("Cleaned up %d stale cooldown entries", len(stale_keys))
 
 
-async def claim_target_for_processing(target_id: int) -> bool:
-    """Atomically claim a pending target for processing."""
+async def _wait_for_account_cooldown(account: dict):
+    """Reserve the account's next report slot, then sleep once until it opens."""
+    config = await _get_delay_config()
+    async with _cooldown_lock:
+        last_ts = _account_last_report.get(account["id"], 0)
+        elapsed = time.monotonic() - last_ts
+        if elapsed < config['account_cooldown']:
+            wait = config['account_cooldown'] - elapsed + random.uniform(0, 5)
+        else:
+            wait = 0
+        # Reserve account immediately with future timestamp to prevent race condition
+        _account_last_report[account["id"]] = time.monotonic() + wait
+
+    if wait > 0:
+        logger.info("[%s] Account cooldown, waiting %.1fs...", account["name"], wait)
+        await asyncio.sleep(wait)
+
+
+async def _rate_limit_backoff(account: dict, attempt: int):
+    """Back off after a 12019 rate-limit response before retrying with the same account."""
+    wait = 90 + random.uniform(0, 15)
+    logger.info("[%s] Rate limited (12019), waiting %.0fs before retry %d...", account["name"], wait, attempt + 1)
+    await asyncio.sleep(wait)
+    # Update timestamp to current time after sleep to avoid double cooldown
+    async with _cooldown_lock:
+        _account_last_report[account["id"]] = time.monotonic()
+
+
+async def claim_target_for_processing(target_id: int) -> dict | None:
+    """Atomically claim a pending target for processing; returns the claimed row, or None."""
 
     async def _operation(conn):
         cursor = await conn.execute(
             "UPDATE targets SET status = 'processing', updated_at = strftime('%Y-%m-%dT%H:%M:%fZ','now') "
-            "WHERE id = ? AND status = 'pending'",
+            "WHERE id = ? AND status = 'pending' RETURNING *",
             (target_id,),
         )
-        return cursor.rowcount > 0
+        row = await cursor.fetchone()
+        return dict(row) if row else None
+
+    return await execute_in_transaction(_operation)
+
+
+async def claim_targets_for_processing(target_ids: list[int]) -> set[int]:
+    """Atomically claim every still-pending target in one statement; returns the claimed ids."""
+    if not target_ids:
+        return set()
+
+    async def _operation(conn):
+        cursor = await conn.execute(
+            "UPDATE targets SET status = 'processing', updated_at = strftime('%Y-%m-%dT%H:%M:%fZ','now') "
+            "WHERE id IN (SELECT value FROM json_each(?)) AND status = 'pending' RETURNING id",
+            (json.dumps(target_ids),),
+        )
+        return {row["id"] for row in await cursor.fetchall()}
 
     return await execute_in_transaction(_operation)
 
 
-async def _claim_target_for_processing(target_id: int) -> bool:
+async def fail_target_with_log(target_id: int, action: str, error_message: str):
+    """Mark a target failed and record why, in one transaction."""
+
+    async def _operation(conn):
+        await conn.execute(
+            "UPDATE targets SET status = 'failed', updated_at = strftime('%Y-%m-%dT%H:%M:%fZ','now') WHERE id = ?",
+            (target_id,),
+        )
+        await conn.execute(
+            "INSERT INTO report_logs (target_id, action, success, error_message) VALUES (?, ?, ?, ?)",
+            (target_id, action, False, error_message),
+        )
+
+    await execute_in_transaction(_operation)
+
+
+async def _claim_target_for_processing(target_id: int) -> dict | None:
     """Backward-compatible alias kept for existing tests/patch points."""
     return await claim_target_for_processing(target_id)
 
 
-async def execute_single_report(target: dict, account: dict) -> dict:
-    """Execute a single report using one account. Returns a result dict."""
-    from backend.core.bilibili_client import BilibiliClient
+@lru_cache(maxsize=1024)
+def _parse_comment_identifier(identifier: str) -> tuple[int | None, int]:
+    """Split an "oid:rpid" (or bare "rpid") comment identifier; oid is None when absent."""
+    if ":" in identifier:
+        oid, _, rpid = identifier.rpartition(":")
+        return int(oid.split(":")[0]), int(rpid)
+    return None, int(identifier)
+
+
+async def execute_single_report(target: dict, account: dict, resolved_aids: dict[int, int] | None = None) -> dict:
+    """Execute a single report using one account. Returns a result dict.
+
+    `resolved_aids` (target id -> aid) lets callers retrying a target with several
+    accounts reuse an aid looked up from its BV id, without writing into `target`.
+    """
+    from backend.core.bilibili_client import BilibiliClient, get_shared_http_client
     from backend.core.bilibili_auth import BilibiliAuth
     from backend.api.websocket import broadcast_log
 
     try:
         auth = BilibiliAuth.from_db_account(account)
 
-        async with BilibiliClient(auth, account_index=0) as client:
+        async with BilibiliClient(auth, account_index=0, client=get_shared_http_client()) as client:
             bvid = target.get("identifier", "") if target.get("identifier", "").startswith("BV") else ""
 
             if target["type"] == "video":
-                aid = target.get("aid") or 0
+                aid = target.get("aid") or (resolved_aids or {}).get(target["id"]) or 0
                 # BV号时自动获取aid
                 if not aid and bvid:
                     info = await client.get_video_info(bvid)
                     if info.get("code") == 0:
                         aid = info["data"]["aid"]
+                        if resolved_aids is not None:
+                            resolved_aids[target["id"]] = aid
                 result = await client.report_video(
                     aid=aid,
                     reason=target.get("reason_id") or 1,
@@ -109,13 +191,9 @@ async def execute_single_report(target: dict, account: dict) -> dict:
                     bvid=bvid,
                 )
             elif target["type"] == "comment":
-                identifier = target["identifier"]
-                if ":" in identifier:
-                    oid = int(identifier.split(":")[0])
-                    rpid = int(identifier.split(":")[-1])
-                else:
+                oid, rpid = _parse_comment_identifier(target["identifier"])
+                if oid is None:
                     oid = target.get("aid") or 0
-                    rpid = int(identifier)
                 # B站评论举报只支持 reason 1-9，其他值会返回 12012
                 comment_reason = target.get("reason_id") or 4
                 if comment_reason not in (1, 2, 3, 4, 5, 7, 8, 9):
@@ -190,11 +268,15 @@ async def execute_single_report(target: dict, account: dict) -> dict:
         }
 
 
-async def execute_report_for_target(target_id: int, account_ids: list[int] | None = None):
-    """Execute reports for a single target using specified or all active accounts."""
+async def execute_report_for_target(target_id: int, account_ids: list[int] | None = None, target: dict | None = None):
+    """Execute reports for a single target using specified or all active accounts.
+
+    Pass the row returned by claim_target_for_processing as `target` to skip re-reading it.
+    """
     from backend.services import target_service, account_service
 
-    target = await target_service.get_target(target_id)
+    if target is None:
+        target = await target_service.get_target(target_id)
     if not target:
         return None, "Target not found"
 
@@ -210,25 +292,19 @@ async def execute_report_for_target(target_id: int, account_ids: list[int] | Non
         await target_service.update_target_status(target_id, "failed")
         return None, f"Target exceeded max retry count ({MAX_RETRY_COUNT})"
 
-    if account_ids:
-        placeholders = ",".join("?" * len(account_ids))
-        accounts = await execute_query(
-            f"SELECT * FROM accounts WHERE id IN ({placeholders}) AND is_active = 1 AND status = 'valid'",
-            tuple(account_ids),
-        )
-    else:
-        accounts = await account_service.get_active_accounts()
+    accounts = await account_service.get_active_accounts(account_ids)
 
     if not accounts:
         return None, "No active accounts available"
 
-    # Status already set to "processing" by the API layer (fire-and-forget)
+    # Status already set to "processing" by the caller's claim
 
     # Shuffle accounts to avoid predictable ordering fingerprint
     accounts = list(accounts)
     random.shuffle(accounts)
 
     results = []
+    resolved_aids: dict[int, int] = {}
     for account in accounts:
         max_rate_retries = 2
         for attempt in range(1 + max_rate_retries):
@@ -236,32 +312,13 @@ async def execute_report_for_target(target_id: int, account_ids: list[int] | Non
             await _cleanup_stale_cooldowns()
 
             # Account cooldown: wait if reported too recently
-            config = await _get_delay_config()
-            async with _cooldown_lock:
-                last_ts = _account_last_report.get(account["id"], 0)
-                elapsed = time.monotonic() - last_ts
-                if elapsed < config['account_cooldown']:
-                    wait = config['account_cooldown'] - elapsed + random.uniform(0, 5)
-                else:
-                    wait = 0
-                # Reserve account immediately with future timestamp to prevent race condition
-                _account_last_report[account["id"]] = time.monotonic() + wait
-
-            if wait > 0:
-                logger.info("[%s] Account cooldown, waiting %.1fs...", account["name"], wait)
-                await asyncio.sleep(wait)
+            await _wait_for_account_cooldown(account)
 
-
-            result = await execute_single_report(target, account)
+            result = await execute_single_report(target, account, resolved_aids)
 
             resp = result.get("response") or {}
             if resp.get("code") == 12019 and attempt < max_rate_retries:
-                wait = 90 + random.uniform(0, 15)
-                logger.info("[%s] Rate limited (12019), waiting %.0fs before retry %d...", account["name"], wait, attempt + 1)
-                await asyncio.sleep(wait)
-                # Update timestamp to current time after sleep to avoid double cooldown
-                async with _cooldown_lock:
-                    _account_last_report[account["id"]] = time.monotonic()
+                await _rate_limit_backoff(account, attempt)
                 continue
             break
 
@@ -288,9 +345,9 @@ async def execute_batch_reports(target_ids: list[int] | None, account_ids: list[
     from backend.services import target_service, account_service
 
     if target_ids:
-        placeholders = ",".join("?" * len(target_ids))
+        # One SQL text for any list length, so the statement cache is reused
         targets = await execute_query(
-            f"SELECT * FROM targets WHERE id IN ({placeholders})", tuple(target_ids)
+            "SELECT * FROM targets WHERE id IN (SELECT value FROM json_each(?))", (json.dumps(target_ids),)
         )
     else:
         targets = await target_service.get_pending_targets()
@@ -298,25 +355,19 @@ async def execute_batch_reports(target_ids: list[int] | None, account_ids: list[
     if not targets:
         return None, "No targets to process"
 
-    if account_ids:
-        placeholders = ",".join("?" * len(account_ids))
-        accounts = await execute_query(
-            f"SELECT * FROM accounts WHERE id IN ({placeholders}) AND is_active = 1 AND status = 'valid'",
-            tuple(account_ids),
-        )
-    else:
-        accounts = await account_service.get_active_accounts()
+    accounts = await account_service.get_active_accounts(account_ids)
 
     if not accounts:
         return None, "No active accounts available"
 
-    semaphore = asyncio.Semaphore(5)
+    semaphore = asyncio.Semaphore(REPORT_BATCH_CONCURRENCY)
+    # Claim the whole batch up front in one UPDATE instead of one transaction per target
+    claimed_ids = await claim_targets_for_processing([target["id"] for target in targets])
 
     async def process_target(target: dict) -> list[dict]:
         """Process a single target with all accounts until success."""
         async with semaphore:
-            claimed = await _claim_target_for_processing(target["id"])
-            if not claimed:
+            if target["id"] not in claimed_ids:
                 logger.info("Skipping target #%d because it is already processing", target["id"])
                 return []
             try:
@@ -324,35 +375,17 @@ async def execute_batch_reports(target_ids: list[int] | None, account_ids: list[
                 random.shuffle(shuffled_accounts)
 
                 results = []
+                resolved_aids: dict[int, int] = {}
                 for account in shuffled_accounts:
                     max_rate_retries = 2
                     for attempt in range(1 + max_rate_retries):
-                        config = await _get_delay_config()
-                        async with _cooldown_lock:
-                            last_ts = _account_last_report.get(account["id"], 0)
-                            elapsed = time.monotonic() - last_ts
-                            if elapsed < config['account_cooldown']:
-                                wait = config['account_cooldown'] - elapsed + random.uniform(0, 5)
-                            else:
-                                wait = 0
-                            # Reserve account immediately with future timestamp to prevent race condition
-                            _account_last_report[account["id"]] = time.monotonic() + wait
+                        await _wait_for_account_cooldown(account)
 
-                        if wait > 0:
-                            logger.info("[%s] Account cooldown, waiting %.1fs...", account["name"], wait)
-                            await asyncio.sleep(wait)
-
-
-                        result = await execute_single_report(target, account)
+                        result = await execute_single_report(target, account, resolved_aids)
 
                         resp = result.get("response") or {}
                         if resp.get("code") == 12019 and attempt < max_rate_retries:
-                            wait = 90 + random.uniform(0, 15)
-                            logger.info("[%s] Rate limited (12019), waiting %.0fs before retry %d...", account["name"], wait, attempt + 1)
-                            await asyncio.sleep(wait)
-                            # Update timestamp to current time after sleep to avoid double cooldown
-                            async with _cooldown_lock:
-                                _account_last_report[account["id"]] = time.monotonic()
+                            await _rate_limit_backoff(account, attempt)
                             continue
                         break
 
@@ -379,12 +412,14 @@ async def execute_batch_reports(target_ids: list[int] | None, account_ids: list[
 
     # Filter out exceptions and ensure failed status
     all_results = []
+    crashed_ids = []
     for i, result in enumerate(all_results_nested):
         if isinstance(result, Exception):
             logger.error("Target #%d processing failed: %s", targets[i]["id"], result)
-            await target_service.update_target_status(targets[i]["id"], "failed")
+            crashed_ids.append(targets[i]["id"])
         else:
             all_results.extend(result)
+    await target_service.update_targets_status(crashed_ids, "failed")
 
     successful = sum(1 for r in all_results if r["success"])
     return {
@@ -405,7 +440,7 @@ async def scan_and_report_comments(
     auto_report: bool = False,
 ) -> dict:
     """Scan comments of a video, create targets, and optionally batch report them."""
-    from backend.core.bilibili_client import BilibiliClient
+    from backend.core.bilibili_client import BilibiliClient, get_shared_http_client
     from backend.core.bilibili_auth import BilibiliAuth
     from backend.services import account_service, target_service
     from backend.api.websocket import broadcast_log
@@ -426,7 +461,7 @@ async def scan_and_report_comments(
     reports_successful = 0
     aid = 0
 
-    async with BilibiliClient(auth, account_index=0) as client:
+    async with BilibiliClient(auth, account_index=0, client=get_shared_http_client()) as client:
         # Step 1: Resolve BV -> aid
         info = await client.get_video_info(bvid)
         if info.get("code") != 0:
@@ -494,25 +529,12 @@ async def scan_and_report_comments(
                 "SELECT * FROM targets WHERE type = 'comment' AND aid = ? AND status = 'pending' ORDER BY id DESC LIMIT ?",
                 (aid, targets_created),
             )
+            claimed_ids = await claim_targets_for_processing([target["id"] for target in pending])
             for target in pending:
-                claimed = await _claim_target_for_processing(target["id"])
-                if not claimed:
+                if target["id"] not in claimed_ids:
                     continue
 
-                # Account cooldown logic (same as main report flow)
-                config = await _get_delay_config()
-                async with _cooldown_lock:
-                    last_ts = _account_last_report.get(account["id"], 0)
-                    elapsed = time.monotonic() - last_ts
-                    if elapsed < config['account_cooldown']:
-                        wait = config['account_cooldown'] - elapsed + random.uniform(0, 5)
-                    else:
-                        wait = 0
-                    _account_last_report[account["id"]] = time.monotonic() + wait
-
-                if wait > 0:
-                    logger.info("[%s] Account cooldown, waiting %.1fs...", account["name"], wait)
-                    await asyncio.sleep(wait)
+                await _wait_for_account_cooldown(account)
 
                 result = await execute_single_report(target, account)
                 reports_executed += 1
@@ -560,3 +582,18 @@ async def get_target_logs(target_id: int, limit: int = 100):
            ORDER BY l.executed_at DESC LIMIT ?""",
         (target_id, limit),
     )
+
+
+def _encode_report_logs(rows: list[dict]) -> bytes:
+    """Validate log rows as ReportLog and encode them to JSON in a single pass."""
+    return _REPORT_LOGS_ADAPTER.dump_json(_REPORT_LOGS_ADAPTER.validate_python(rows))
+
+
+async def get_report_logs_json(limit: int = 100) -> bytes:
+    """Same as get_report_logs, pre-encoded as a JSON body."""
+    return _encode_report_logs(await get_report_logs(limit))
+
+
+async def get_target_logs_json(target_id: int, limit: int = 100) -> bytes:
+    """Same as get_target_logs, pre-encoded as a JSON body."""
+    return _encode_report_logs(await get_target_logs(target_id, limit))
@@ -1,7 +1,6 @@
 """Scheduler business logic."""
 import json
-import asyncio
-import random
+from functools import lru_cache
 from typing import Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -9,8 +8,8 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from backend.models.task import ScheduledTaskBase, ScheduledTaskCreate
-from backend.database import execute_query, execute_insert, invalidate_cache
-from backend.config import MIN_DELAY, MAX_DELAY
+from backend.database import execute_query, execute_write, invalidate_cache
+from backend.config import SCHEDULER_MAX_INSTANCES, SCHEDULER_MISFIRE_GRACE_SECONDS
 from backend.logger import logger
 
 _scheduler: AsyncIOScheduler | None = None
@@ -24,8 +23,8 @@ def get_scheduler() -> AsyncIOScheduler:
         _scheduler = AsyncIOScheduler(
             job_defaults={
                 'coalesce': True,
-                'max_instances': 1,
-                'misfire_grace_time': 60
+                'max_instances': SCHEDULER_MAX_INSTANCES,
+                'misfire_grace_time': SCHEDULER_MISFIRE_GRACE_SECONDS
             }
         )
     return _scheduler
@@ -176,14 +175,14 @@ async def _run_cookie_health_check(task_id: int):
                                 "UPDATE accounts SET status = 'expiring' WHERE id = ?",
                                 (account["id"],),
                             )
-                            await invalidate_cache("active_accounts")
+                            await invalidate_cache("accounts")
                     else:
                         await broadcast_log("auth", f"[{account['name']}] No refresh_token. QR re-login required.")
                         await execute_query(
                             "UPDATE accounts SET status = 'expiring' WHERE id = ?",
                             (account["id"],),
                         )
-                        await invalidate_cache("active_accounts")
+                        await invalidate_cache("accounts")
             except Exception as e:
                 logger.error("[Cookie Health][%s] Error: %s", account.get("name", "?"), e)
                 await broadcast_log("auth", f"[{account.get('name', '?')}] Cookie health check error: Internal error occurred")
@@ -213,17 +212,11 @@ async def _run_log_cleanup(task_id: int):
         except (TypeError, ValueError):
             retention_days = 30
 
-        count_rows = await execute_query(
-            "SELECT COUNT(*) as count FROM report_logs WHERE executed_at < datetime('now', ?)",
+        count = await execute_write(
+            "DELETE FROM report_logs WHERE executed_at < datetime('now', ?)",
             (f"-{retention_days} days",),
         )
-        count = count_rows[0]["count"] if count_rows else 0
-
         if count > 0:
-            await execute_query(
-                "DELETE FROM report_logs WHERE executed_at < datetime('now', ?)",
-                (f"-{retention_days} days",),
-            )
             logger.info("[Log Cleanup] Deleted %d logs older than %d days", count, retention_days)
             await broadcast_log("system", f"Log cleanup: deleted {count} logs older than {retention_days} days")
     except Exception as e:
@@ -239,6 +232,15 @@ _JOB_FUNCTIONS = {"report_batch": _run_report_batch, "autoreply_poll": _run_auto
 
 # ── Job registration ──────────────────────────────────────────────────────
 
+@lru_cache(maxsize=256)
+def _cron_trigger(expression: str) -> CronTrigger:
+    """Parse a crontab expression once; CronTrigger holds no per-job state, so jobs can share it.
+
+    IntervalTrigger is not cached: it pins its start_date when constructed.
+    """
+    return CronTrigger.from_crontab(expression)
+
+
 def _register_job(task_row: dict):
     """Register a DB task row as an APScheduler job."""
     scheduler = get_scheduler()
@@ -249,7 +251,7 @@ def _register_job(task_row: dict):
         return
     try:
         if task_row.get("cron_expression"):
-            trigger = CronTrigger.from_crontab(task_row["cron_expression"])
+            trigger = _cron_trigger(task_row["cron_expression"])
         elif task_row.get("interval_seconds"):
             trigger = IntervalTrigger(seconds=task_row["interval_seconds"])
         else:
@@ -305,7 +307,7 @@ def _normalize_trigger_values(
     cron_valid = False
     if cron_value is not None:
         try:
-            CronTrigger.from_crontab(cron_value)
+            _cron_trigger(cron_value)
             cron_valid = True
         except Exception:
             cron_value = None
@@ -386,8 +388,8 @@ async def create_task(name, task_type, cron_expression=None, interval_seconds=No
         config_json=config_json,
     )
     config_str = json.dumps(validated.config_json) if validated.config_json is not None else None
-    task_id = await execute_insert(
-        "INSERT INTO scheduled_tasks (name, task_type, cron_expression, interval_seconds, config_json) VALUES (?, ?, ?, ?, ?)",
+    rows = await execute_query(
+        "INSERT INTO scheduled_tasks (name, task_type, cron_expression, interval_seconds, config_json) VALUES (?, ?, ?, ?, ?) RETURNING *",
         (
             validated.name,
             validated.task_type,
@@ -396,13 +398,12 @@ async def create_task(name, task_type, cron_expression=None, interval_seconds=No
             config_str,
         ),
     )
-    rows = await execute_query("SELECT * FROM scheduled_tasks WHERE id = ?", (task_id,))
     row = _parse_config_json(rows[0])
     if row.get("is_active", True):
         try:
             _register_job(row)
         except Exception as e:
-            await _deactivate_task_after_job_failure(task_id, e)
+            await _deactivate_task_after_job_failure(row["id"], e)
             raise
     return row
 
@@ -469,8 +470,7 @@ async def update_task(task_id: int, fields: dict):
         try:
             # Pre-validate trigger configuration
             if validation_row.get("cron_expression"):
-                from apscheduler.triggers.cron import CronTrigger
-                CronTrigger.from_crontab(validation_row["cron_expression"])
+                _cron_trigger(validation_row["cron_expression"])
             elif validation_row.get("interval_seconds"):
                 from apscheduler.triggers.interval import IntervalTrigger
                 IntervalTrigger(seconds=validation_row["interval_seconds"])
@@ -479,10 +479,9 @@ async def update_task(task_id: int, fields: dict):
         except Exception as e:
             raise ValueError(f"Invalid trigger configuration: {e}")
     
-    await execute_query(
-        f"UPDATE scheduled_tasks SET {', '.join(updates)} WHERE id = ?", tuple(params)
+    rows = await execute_query(
+        f"UPDATE scheduled_tasks SET {', '.join(updates)} WHERE id = ? RETURNING *", tuple(params)
     )
-    rows = await execute_query("SELECT * FROM scheduled_tasks WHERE id = ?", (task_id,))
     if not rows:
         return None
     row = _parse_config_json(rows[0])
@@ -498,11 +497,9 @@ async def update_task(task_id: int, fields: dict):
 
 
 async def delete_task(task_id: int) -> bool:
-    rows = await execute_query("SELECT * FROM scheduled_tasks WHERE id = ?", (task_id,))
-    if not rows:
+    if not await execute_write("DELETE FROM scheduled_tasks WHERE id = ?", (task_id,)):
         return False
     _unregister_job(task_id)
-    await execute_query("DELETE FROM scheduled_tasks WHERE id = ?", (task_id,))
     return True
 
 
@@ -1,7 +1,8 @@
 """Target business logic."""
+import json
 import sqlite3
 from typing import Optional
-from backend.database import execute_query, execute_insert, execute_many
+from backend.database import execute_in_transaction, execute_query, execute_write
 
 # Whitelist of fields allowed in dynamic UPDATE statements
 ALLOWED_UPDATE_FIELDS = {"reason_id", "reason_content_id", "reason_text", "status"}
@@ -52,8 +53,9 @@ async def get_target(target_id: int):
 
 async def create_target(target_type: str, identifier: str, aid=None, reason_id=None, reason_content_id=None, reason_text=None, display_text=None):
     try:
-        target_id = await execute_insert(
-            "INSERT INTO targets (type, identifier, aid, reason_id, reason_content_id, reason_text, display_text) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows = await execute_query(
+            "INSERT INTO targets (type, identifier, aid, reason_id, reason_content_id, reason_text, display_text) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) RETURNING *",
             (target_type, identifier, aid, reason_id, reason_content_id, reason_text, display_text),
         )
     except sqlite3.IntegrityError as e:
@@ -65,25 +67,26 @@ async def create_target(target_type: str, identifier: str, aid=None, reason_id=N
             )
             return rows[0] if rows else None
         raise
-    rows = await execute_query("SELECT * FROM targets WHERE id = ?", (target_id,))
     return rows[0]
 
 
-async def create_targets_batch(target_type: str, identifiers: list[str], reason_id=None, reason_content_id=None, reason_text=None):
-    params_list = [
-        (target_type, identifier, None, reason_id, reason_content_id, reason_text)
-        for identifier in identifiers
-    ]
-    await execute_many(
-        "INSERT OR IGNORE INTO targets (type, identifier, aid, reason_id, reason_content_id, reason_text) VALUES (?, ?, ?, ?, ?, ?)",
-        params_list,
-    )
-    # Query actual inserted count (INSERT OR IGNORE silently skips duplicates)
-    result = await execute_query(
-        "SELECT COUNT(*) as count FROM targets WHERE type = ? AND identifier IN ({})".format(','.join('?' * len(identifiers))),
-        (target_type, *identifiers),
-    )
-    return result[0]["count"] if result else 0
+async def create_targets_batch(target_type: str, identifiers: list[str], reason_id=None, reason_content_id=None, reason_text=None) -> list[int]:
+    """Insert targets in one transaction and return the IDs of the rows actually created."""
+    async def _operation(conn) -> list[int]:
+        created: list[int] = []
+        for identifier in identifiers:
+            # INSERT OR IGNORE returns no row for duplicates, so only new IDs are collected
+            cursor = await conn.execute(
+                "INSERT OR IGNORE INTO targets (type, identifier, reason_id, reason_content_id, reason_text) "
+                "VALUES (?, ?, ?, ?, ?) RETURNING id",
+                (target_type, identifier, reason_id, reason_content_id, reason_text),
+            )
+            row = await cursor.fetchone()
+            if row:
+                created.append(row[0])
+        return created
+
+    return await execute_in_transaction(_operation)
 
 
 async def update_target(target_id: int, fields: dict):
@@ -99,31 +102,20 @@ async def update_target(target_id: int, fields: dict):
 
     updates.append("updated_at = strftime('%Y-%m-%dT%H:%M:%fZ','now')")
     params.append(target_id)
-    await execute_query(
-        f"UPDATE targets SET {', '.join(updates)} WHERE id = ?", tuple(params)
+    rows = await execute_query(
+        f"UPDATE targets SET {', '.join(updates)} WHERE id = ? RETURNING *", tuple(params)
     )
-
-    rows = await execute_query("SELECT * FROM targets WHERE id = ?", (target_id,))
     return rows[0] if rows else None
 
 
 async def delete_target(target_id: int) -> bool:
-    rows = await execute_query("SELECT * FROM targets WHERE id = ?", (target_id,))
-    if not rows:
-        return False
-    await execute_query("DELETE FROM targets WHERE id = ?", (target_id,))
-    return True
+    return await execute_write("DELETE FROM targets WHERE id = ?", (target_id,)) > 0
 
 
 async def delete_targets_by_status(status: str) -> int:
     if status not in VALID_STATUSES:
         raise ValueError(f"Invalid target status: {status}. Must be one of {VALID_STATUSES}")
-    count_rows = await execute_query(
-        "SELECT COUNT(*) as count FROM targets WHERE status = ?", (status,)
-    )
-    count = count_rows[0]["count"] if count_rows else 0
-    await execute_query("DELETE FROM targets WHERE status = ?", (status,))
-    return count
+    return await execute_write("DELETE FROM targets WHERE status = ?", (status,))
 
 
 async def update_target_status(target_id: int, status: str):
@@ -135,6 +127,18 @@ async def update_target_status(target_id: int, status: str):
     )
 
 
+async def update_targets_status(target_ids: list[int], status: str):
+    if status not in VALID_STATUSES:
+        raise ValueError(f"Invalid target status: {status}. Must be one of {VALID_STATUSES}")
+    if not target_ids:
+        return
+    await execute_query(
+        "UPDATE targets SET status = ?, updated_at = strftime('%Y-%m-%dT%H:%M:%fZ','now') "
+        "WHERE id IN (SELECT value FROM json_each(?))",
+        (status, json.dumps(target_ids)),
+    )
+
+
 async def increment_retry_and_set_status(target_id: int, status: str):
     if status not in VALID_STATUSES:
         raise ValueError(f"Invalid target status: {status}. Must be one of {VALID_STATUSES}")
@@ -56,3 +56,124 @@ async def test_update_account_keeps_status_when_credentials_not_changed():
     assert same_value_result["status"] == "valid"
     assert same_value_result["last_check_at"] == last_check_at
     await close_db()
+
+
+@pytest.mark.asyncio
+async def test_update_account_reuses_sql_for_same_field_set():
+    await init_db()
+    account_id = await execute_insert(
+        "INSERT INTO accounts (name, sessdata, bili_jct) VALUES (?, ?, ?)",
+        ("acc", "sess", "jct"),
+    )
+    account_service._build_update_sql.cache_clear()
+
+    await account_service.update_account(account_id, {"name": "a1", "group_tag": "g1"})
+    await account_service.update_account(account_id, {"group_tag": "g2", "name": "a2"})
+
+    info = account_service._build_update_sql.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    rows = await execute_query("SELECT name, group_tag FROM accounts WHERE id = ?", (account_id,))
+    assert rows[0] == {"name": "a2", "group_tag": "g2"}
+    await close_db()
+
+
+@pytest.mark.asyncio
+async def test_check_account_validity_always_queries_nav_and_updates_row(monkeypatch):
+    import httpx
+
+    await init_db()
+    account_id = await execute_insert(
+        "INSERT INTO accounts (name, sessdata, bili_jct, buvid3) VALUES (?, ?, ?, ?)",
+        ("acc", "sess", "jct", "b3"),
+    )
+    calls = []
+
+    def handler(request):
+        calls.append(request.headers.get("cookie"))
+        return httpx.Response(200, json={"code": 0, "data": {"mid": 42}})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(account_service, "_get_http_client", lambda: client)
+
+    first = await account_service.check_account_validity(account_id)
+    assert first["is_valid"] is True and first["uid"] == 42
+    assert calls == ["SESSDATA=sess; bili_jct=jct; buvid3=b3"]
+
+    # A repeat check still reaches the nav API and rewrites a status changed in between
+    await execute_query("UPDATE accounts SET status = 'invalid' WHERE id = ?", (account_id,))
+    second = await account_service.check_account_validity(account_id)
+    assert second == first
+    assert len(calls) == 2
+    rows = await execute_query("SELECT status FROM accounts WHERE id = ?", (account_id,))
+    assert rows[0]["status"] == "valid"
+
+    await client.aclose()
+    await close_db()
+
+
+@pytest.mark.asyncio
+async def test_import_accounts_inserts_batch_in_one_transaction():
+    from backend.models.account import AccountImport
+
+    await init_db()
+    try:
+        result = await account_service.import_accounts([
+            AccountImport(name="a", sessdata="s1", bili_jct="j1"),
+            AccountImport(name="b", sessdata="s2", bili_jct="j2", group_tag="vip"),
+        ])
+        assert result == {"created": 2, "skipped": 0, "total": 2}
+        rows = await execute_query("SELECT name, group_tag, buvid3 FROM accounts ORDER BY id")
+        assert rows == [
+            {"name": "a", "group_tag": "default", "buvid3": ""},
+            {"name": "b", "group_tag": "vip", "buvid3": ""},
+        ]
+    finally:
+        await close_db()
+
+
+@pytest.mark.asyncio
+async def test_import_accounts_skips_only_rows_that_violate_constraints():
+    from backend.models.account import AccountImport
+
+    await init_db()
+    try:
+        await execute_query("CREATE UNIQUE INDEX test_accounts_name ON accounts(name)")
+        await execute_insert(
+            "INSERT INTO accounts (name, sessdata, bili_jct) VALUES (?, ?, ?)", ("taken", "s0", "j0")
+        )
+        result = await account_service.import_accounts([
+            AccountImport(name="a", sessdata="s1", bili_jct="j1"),
+            AccountImport(name="taken", sessdata="s2", bili_jct="j2"),
+            AccountImport(name="b", sessdata="s3", bili_jct="j3"),
+        ])
+        assert result == {"created": 2, "skipped": 1, "total": 3}
+        rows = await execute_query("SELECT name, sessdata FROM accounts ORDER BY id")
+        assert rows == [
+            {"name": "taken", "sessdata": "s0"},
+            {"name": "a", "sessdata": "s1"},
+            {"name": "b", "sessdata": "s3"},
+        ]
+    finally:
+        await close_db()
+
+
+@pytest.mark.asyncio
+async def test_get_active_accounts_filters_cached_rows_and_sees_invalidation():
+    await init_db()
+    try:
+        ids = [
+            await execute_insert(
+                "INSERT INTO accounts (name, sessdata, bili_jct, status) VALUES (?, ?, ?, ?)",
+                (name, "s", "j", status),
+            )
+            for name, status in (("a", "valid"), ("b", "valid"), ("c", "invalid"))
+        ]
+
+        assert [a["name"] for a in await account_service.get_active_accounts([ids[1], ids[2]])] == ["b"]
+        assert len(await account_service.get_active_accounts()) == 2
+
+        await account_service.delete_account(ids[0])
+        assert [a["name"] for a in await account_service.get_active_accounts()] == ["b"]
+    finally:
+        await close_db()
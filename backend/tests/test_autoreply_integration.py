@@ -99,7 +99,7 @@ async def test_poll_cycle_matches_keyword_and_default_rules(monkeypatch):
     sent_messages = []
 
     class MockBilibiliClient:
-        def __init__(self, auth, account_index=0):
+        def __init__(self, auth, account_index=0, client=None):
             self.auth = auth
             self.account_index = account_index
 
@@ -169,7 +169,7 @@ async def test_poll_cycle_sends_reply_and_persists_log_once_for_same_message(mon
     send_calls = []
 
     class MockBilibiliClient:
-        def __init__(self, auth, account_index=0):
+        def __init__(self, auth, account_index=0, client=None):
             self.auth = auth
             self.account_index = account_index
 
@@ -1,4 +1,5 @@
 import asyncio
+import json
 from contextlib import suppress
 
 import pytest
@@ -29,6 +30,67 @@ async def test_upsert_default_reply_keeps_single_null_keyword_row_under_concurre
         await close_db()
 
 
+@pytest.mark.asyncio
+async def test_list_configs_cache_is_invalidated_by_mutations():
+    await init_db()
+    try:
+        created = await autoreply_service.create_config("hello", "hi", 1)
+        assert [row["id"] for row in await autoreply_service.list_configs()] == [created["id"]]
+
+        assert b'"response": "hi"' in await autoreply_service.list_configs_json()
+
+        await autoreply_service.update_config(created["id"], {"response": "hey"})
+        assert (await autoreply_service.list_configs())[0]["response"] == "hey"
+        assert b'"response": "hey"' in await autoreply_service.list_configs_json()
+
+        page = json.loads(await autoreply_service.list_configs_page_json(1, 10))
+        assert page["total"] == 1 and [row["id"] for row in page["items"]] == [created["id"]]
+
+        await autoreply_service.delete_config(created["id"])
+        assert await autoreply_service.list_configs() == []
+        assert json.loads(await autoreply_service.list_configs_page_json(1, 10))["total"] == 0
+    finally:
+        await close_db()
+
+
+@pytest.mark.asyncio
+async def test_reply_matcher_is_cached_until_configs_change():
+    from backend.services.autoreply_polling import load_reply_matcher
+
+    await init_db()
+    try:
+        created = await autoreply_service.create_config("price", "see pinned post", 1)
+        matcher = await load_reply_matcher()
+        assert matcher("what is the price?") == "see pinned post"
+        assert await load_reply_matcher() is matcher
+
+        await autoreply_service.update_config(created["id"], {"response": "DM me"})
+        assert (await load_reply_matcher())("price?") == "DM me"
+
+        await autoreply_service.delete_config(created["id"])
+        assert (await load_reply_matcher())("price?") == "您好，稍后回复。"
+    finally:
+        await close_db()
+
+
+def test_reply_matcher_skips_shadowed_rules_without_changing_results():
+    from backend.services.autoreply_polling import build_reply_matcher
+
+    configs = [
+        {"keyword": "price", "response": "A", "priority": 3, "is_active": 1},
+        {"keyword": "price list", "response": "never", "priority": 2, "is_active": 1},
+        {"keyword": "price", "response": "never", "priority": 2, "is_active": 1},
+        {"keyword": "list", "response": "B", "priority": 1, "is_active": 1},
+        {"keyword": None, "response": "default", "priority": 0, "is_active": 1},
+    ]
+    matcher = build_reply_matcher(configs)
+    assert matcher("send the price list") == "A"
+    assert matcher("a list please") == "B"
+    # Priority, not position in the message, decides between matching rules
+    assert matcher("list the price") == "A"
+    assert matcher("hello") == "default"
+
+
 @pytest.mark.asyncio
 async def test_match_reply_rule_keeps_creation_order_for_same_priority_rules():
     await init_db()
@@ -76,7 +138,7 @@ async def test_send_failure_always_updates_dedup_state(monkeypatch):
     msg_ts = 1700000000
 
     class MockBilibiliClient:
-        def __init__(self, auth, account_index=0):
+        def __init__(self, auth, account_index=0, client=None):
             self.auth = auth
             self.account_index = account_index
 
@@ -210,7 +272,7 @@ async def test_start_service_respects_configured_batch_sizes(monkeypatch):
     sent_to = []
 
     class MockBilibiliClient:
-        def __init__(self, auth, account_index=0):
+        def __init__(self, auth, account_index=0, client=None):
             self.auth = auth
             self.account_index = account_index
 
@@ -286,7 +348,7 @@ async def test_runtime_interval_config_update_applies_without_restart(monkeypatc
     original_sleep = asyncio.sleep
 
     class MockBilibiliClient:
-        def __init__(self, auth, account_index=0):
+        def __init__(self, auth, account_index=0, client=None):
             self.auth = auth
             self.account_index = account_index
 
@@ -332,3 +394,102 @@ async def test_runtime_interval_config_update_applies_without_restart(monkeypatc
                 await task
         autoreply_service._autoreply_task = None
         await close_db()
+
+
+@pytest.mark.asyncio
+async def test_poll_cycle_polls_accounts_concurrently(monkeypatch):
+    from backend.services.autoreply_polling import STANDALONE_AUTOREPLY_ACCOUNTS_QUERY, run_autoreply_poll_cycle
+
+    await init_db()
+    for name, uid in (("acc-slow", 10001), ("acc-fast", 20002)):
+        await execute_insert(
+            """INSERT INTO accounts
+               (name, sessdata, bili_jct, uid, is_active, status)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (name, f"sess-{uid}", f"jct-{uid}", uid, 1, "valid"),
+        )
+
+    fast_account_polled = asyncio.Event()
+    replied_accounts = []
+
+    class MockBilibiliClient:
+        def __init__(self, auth, account_index=0, client=None):
+            self.name = auth.accounts[account_index]["name"]
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+        async def get_recent_sessions(self):
+            # The slow account only finishes once the other account has been polled,
+            # which can only happen if accounts are processed concurrently.
+            if self.name == "acc-slow":
+                await asyncio.wait_for(fast_account_polled.wait(), timeout=1)
+            else:
+                fast_account_polled.set()
+            return {
+                "code": 0,
+                "data": {"session_list": [{"talker_id": 30001, "last_msg": {"timestamp": 1700000001, "content": "hi"}}]},
+            }
+
+        async def send_private_message(self, _talker_id, _content):
+            replied_accounts.append(self.name)
+            return {"code": 0}
+
+    monkeypatch.setattr(bilibili_client_module, "BilibiliClient", MockBilibiliClient)
+    monkeypatch.setattr("backend.services.autoreply_polling.AUTOREPLY_SEND_DELAY", 0)
+
+    try:
+        await run_autoreply_poll_cycle(account_query=STANDALONE_AUTOREPLY_ACCOUNTS_QUERY)
+        assert sorted(replied_accounts) == ["acc-fast", "acc-slow"]
+    finally:
+        await close_db()
+
+
+@pytest.mark.asyncio
+async def test_poll_cycle_caps_accounts_in_flight(monkeypatch):
+    from backend.services import autoreply_polling
+    from backend.services.autoreply_polling import STANDALONE_AUTOREPLY_ACCOUNTS_QUERY, run_autoreply_poll_cycle
+
+    await init_db()
+    for uid in range(10001, 10006):
+        await execute_insert(
+            """INSERT INTO accounts
+               (name, sessdata, bili_jct, uid, is_active, status)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (f"acc-{uid}", f"sess-{uid}", f"jct-{uid}", uid, 1, "valid"),
+        )
+
+    in_flight = 0
+    peak = 0
+    polled = []
+
+    async def fake_poll_account(account, _match_reply, _on_reply_sent, _session_batch_size):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        polled.append(account["name"])
+        return 1
+
+    monkeypatch.setattr(autoreply_polling, "AUTOREPLY_ACCOUNT_CONCURRENCY", 2)
+    monkeypatch.setattr(autoreply_polling, "_poll_account", fake_poll_account)
+
+    try:
+        assert await run_autoreply_poll_cycle(account_query=STANDALONE_AUTOREPLY_ACCOUNTS_QUERY) == 5
+        assert peak == 2
+        assert len(polled) == 5
+    finally:
+        await close_db()
+
+
+def test_next_poll_delay_backs_off_only_when_enabled():
+    assert autoreply_service._next_poll_delay(30, 0, 5) == 30
+    assert autoreply_service._next_poll_delay(30, 240, 0) == 30
+
+    for idle_cycles, expected in ((1, 60), (2, 120), (3, 240), (10, 240)):
+        delay = autoreply_service._next_poll_delay(30, 240, idle_cycles)
+        assert expected * 0.9 <= delay <= expected * 1.1
@@ -44,3 +44,24 @@ async def test_account_crud():
     rows = await execute_query("SELECT * FROM accounts WHERE id = ?", (aid,))
     assert rows == []
     await close_db()
+
+
+@pytest.mark.asyncio
+async def test_verify_api_key_rejects_non_ascii_key_with_401(monkeypatch):
+    from fastapi import HTTPException
+    from starlette.requests import Request
+
+    import backend.auth as auth_mod
+
+    monkeypatch.setattr(auth_mod, "_API_KEY_BYTES", b"secret")
+
+    def make_request(key: bytes) -> Request:
+        return Request({
+            "type": "http", "method": "GET", "path": "/api/accounts/", "query_string": b"",
+            "headers": [(b"x-api-key", key)],
+        })
+
+    await auth_mod.verify_api_key(make_request(b"secret"))
+    with pytest.raises(HTTPException) as exc_info:
+        await auth_mod.verify_api_key(make_request("sécret".encode("latin-1")))
+    assert exc_info.value.status_code == 401
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import backend.api.reports as reports_api
+from backend.database import close_db, execute_insert, execute_query, init_db
+from backend.models.report import ReportExecuteRequest
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_runs_queued_jobs_with_bounded_concurrency(monkeypatch):
+    monkeypatch.setattr(reports_api, "REPORT_WORKERS", 2)
+    running = 0
+    peak = 0
+    done = []
+
+    async def job(i):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        done.append(i)
+
+    try:
+        for i in range(10):
+            assert reports_api._enqueue_job(job, i)
+        await reports_api._job_queue.join()
+    finally:
+        await reports_api.stop_report_workers()
+
+    assert sorted(done) == list(range(10))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_report_returns_503_and_leaves_target_pending_when_queue_full(monkeypatch):
+    monkeypatch.setattr(reports_api, "REPORT_QUEUE_SIZE", 1)
+    monkeypatch.setattr(reports_api, "REPORT_WORKERS", 1)
+    await init_db()
+    try:
+        target_id = await execute_insert(
+            "INSERT INTO targets (type, identifier, status) VALUES (?, ?, ?)",
+            ("video", "BV1xx411c7mD", "pending"),
+        )
+        blocker = asyncio.Event()
+        # One job occupies the worker, a second fills the queue
+        assert reports_api._enqueue_job(blocker.wait)
+        await asyncio.sleep(0)
+        assert reports_api._enqueue_job(blocker.wait)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await reports_api.execute_report(ReportExecuteRequest(target_id=target_id))
+
+        assert exc_info.value.status_code == 503
+        rows = await execute_query("SELECT status FROM targets WHERE id = ?", (target_id,))
+        assert rows[0]["status"] == "pending"
+        blocker.set()
+    finally:
+        await reports_api.stop_report_workers()
+        await close_db()
+
+
+@pytest.mark.asyncio
+async def test_execute_report_claims_target_only_when_worker_runs_it(monkeypatch):
+    monkeypatch.setattr(reports_api, "REPORT_WORKERS", 1)
+    await init_db()
+    try:
+        target_id = await execute_insert(
+            "INSERT INTO targets (type, identifier, status) VALUES (?, ?, ?)",
+            ("video", "BV1xx411c7mD", "pending"),
+        )
+        claimed = []
+
+        async def fake_execute(tid, account_ids=None, target=None):
+            claimed.append(target["status"])
+            return [], None
+
+        monkeypatch.setattr(reports_api.report_service, "execute_report_for_target", fake_execute)
+        blocker = asyncio.Event()
+        assert reports_api._enqueue_job(blocker.wait)
+        await asyncio.sleep(0)
+
+        await reports_api.execute_report(ReportExecuteRequest(target_id=target_id))
+        # Queued behind the busy worker: still pending, and a repeat request is accepted too
+        rows = await execute_query("SELECT status FROM targets WHERE id = ?", (target_id,))
+        assert rows[0]["status"] == "pending"
+        await reports_api.execute_report(ReportExecuteRequest(target_id=target_id))
+
+        blocker.set()
+        await reports_api._job_queue.join()
+        # Only one of the two queued jobs wins the claim
+        assert claimed == ["processing"]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await reports_api.execute_report(ReportExecuteRequest(target_id=target_id))
+        assert exc_info.value.status_code == 409
+        with pytest.raises(HTTPException) as exc_info:
+            await reports_api.execute_report(ReportExecuteRequest(target_id=target_id + 100))
+        assert exc_info.value.status_code == 404
+    finally:
+        await reports_api.stop_report_workers()
+        await close_db()
@@ -0,0 +1,47 @@
+import asyncio
+import json
+
+import pytest
+
+import backend.api.websocket as websocket_module
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.frames: list[str] = []
+
+    async def send_text(self, text: str):
+        self.frames.append(text)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_log_coalesces_bursts_into_one_frame(monkeypatch):
+    ws = _FakeWebSocket()
+    subscriber = websocket_module._Subscriber(ws)
+    monkeypatch.setattr(websocket_module, "_clients", {subscriber})
+    sender = asyncio.create_task(subscriber.run_sender())
+    try:
+        for i in range(5):
+            await websocket_module.broadcast_log("report", f"line {i}")
+        await asyncio.sleep(websocket_module._BATCH_WINDOW_SECONDS * 3)
+
+        await websocket_module.broadcast_log("report", "single")
+        await asyncio.sleep(websocket_module._BATCH_WINDOW_SECONDS * 3)
+    finally:
+        sender.cancel()
+
+    assert len(ws.frames) == 2
+    burst = json.loads(ws.frames[0])
+    assert [entry["message"] for entry in burst] == [f"line {i}" for i in range(5)]
+    assert json.loads(ws.frames[1])["message"] == "single"
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_messages_instead_of_blocking(monkeypatch):
+    subscriber = websocket_module._Subscriber(_FakeWebSocket())
+    monkeypatch.setattr(websocket_module, "_clients", {subscriber})
+
+    for i in range(websocket_module._SUBSCRIBER_QUEUE_SIZE + 10):
+        await websocket_module.broadcast_log("report", f"line {i}")
+
+    assert subscriber.queue.qsize() == websocket_module._SUBSCRIBER_QUEUE_SIZE
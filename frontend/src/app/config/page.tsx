@@ -67,6 +67,7 @@ export default function ConfigPage() {
     autoreply_poll_min_interval_seconds: "10",
     autoreply_account_batch_size: "0",
     autoreply_session_batch_size: "5",
+    autoreply_idle_max_interval_seconds: "0",
   });
 
   useEffect(() => {
@@ -83,6 +84,7 @@ export default function ConfigPage() {
         autoreply_poll_min_interval_seconds: String(configs.autoreply_poll_min_interval_seconds ?? prev.autoreply_poll_min_interval_seconds),
         autoreply_account_batch_size: String(configs.autoreply_account_batch_size ?? prev.autoreply_account_batch_size),
         autoreply_session_batch_size: String(configs.autoreply_session_batch_size ?? prev.autoreply_session_batch_size),
+        autoreply_idle_max_interval_seconds: String(configs.autoreply_idle_max_interval_seconds ?? prev.autoreply_idle_max_interval_seconds),
       }));
     }
   }, [configs]);
@@ -102,6 +104,7 @@ export default function ConfigPage() {
         autoreply_poll_min_interval_seconds: parseInt(formState.autoreply_poll_min_interval_seconds) || 10,
         autoreply_account_batch_size: parseInt(formState.autoreply_account_batch_size) || 0,
         autoreply_session_batch_size: parseInt(formState.autoreply_session_batch_size) || 5,
+        autoreply_idle_max_interval_seconds: parseInt(formState.autoreply_idle_max_interval_seconds) || 0,
       });
       mutateConfigs();
       toast.success("配置已保存");
@@ -239,6 +242,14 @@ export default function ConfigPage() {
               onChange={(e) => setFormState({...formState, autoreply_session_batch_size: e.target.value})}
               className="text-xs w-20 text-center" />
           </ConfigItem>
+          <ConfigItem
+            label="空闲最大轮询间隔"
+            description="无新消息时轮询间隔逐步翻倍的上限（秒，0=关闭）"
+          >
+            <Input type="number" min={0} max={3600} value={formState.autoreply_idle_max_interval_seconds}
+              onChange={(e) => setFormState({...formState, autoreply_idle_max_interval_seconds: e.target.value})}
+              className="text-xs w-20 text-center" />
+          </ConfigItem>
         </ConfigSection>
 
         {/* System Info */}
@@ -80,9 +80,13 @@ export function useLogStream(maxLogs = 100) {
       ws.onmessage = (event) => {
         if (!isMountedRef.current || ws !== wsRef.current) return;
         try {
-          const entry = JSON.parse(event.data) as LogEntry;
-          if (entry.type === 'heartbeat' || entry.type === 'pong' || entry.type === 'connected') return;
-          setLogs(prev => [entry, ...prev].slice(0, maxLogs));
+          // Bursts arrive as one JSON array, oldest first
+          const parsed = JSON.parse(event.data) as LogEntry | LogEntry[];
+          const entries = (Array.isArray(parsed) ? parsed : [parsed]).filter(
+            entry => entry.type !== 'heartbeat' && entry.type !== 'pong' && entry.type !== 'connected'
+          );
+          if (entries.length === 0) return;
+          setLogs(prev => [...entries.reverse(), ...prev].slice(0, maxLogs));
         } catch {}
       };
     }